@@ -61,6 +61,7 @@ def sqs(
     when: Callable = None,
     assume_role=None,
     message_group_id: Optional[Union[Callable, str]]=None,
+    message_callable_returns: str = "auto",
 ):
     return clearskies.BindingConfig(
         SQS,
@@ -71,6 +72,7 @@ def sqs(
         when=when,
         assume_role=assume_role,
         message_group_id=message_group_id,
+        message_callable_returns=message_callable_returns,
     )
 def step_function(
     arn: str = "",
@@ -1,35 +1,59 @@
 import boto3
+import inspect
 import json
 import logging
+import sys
+import weakref
 
-from abc import ABC
-from boto3 import client
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from clearskies.environment import Environment
+from concurrent.futures import ThreadPoolExecutor
 from clearskies.models import Models
 from clearskies.functional import string
-from collections import OrderedDict
 from typing import Callable, Optional
 
 from ..di import StandardDependencies
 from .assume_role import AssumeRole
-class ActionAws(ABC):
+
+# shared client config for all actions: keep connections alive and pool them so actions
+# firing in a tight loop don't re-run the DNS/TCP/TLS handshake per send
+CLIENT_CONFIG = Config(max_pool_connections=50, tcp_keepalive=True)
+
+# boto3 clients are thread-safe, so clients built without assume-role credentials can be
+# shared by every action instance in the process, pooling their HTTP connections.  The
+# cache is keyed weakly by the injected boto3 module (so mocked boto3 objects in tests
+# don't leak into each other) and then by (service, region).
+_shared_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+class ActionAws:
 
     _logging = logging.getLogger(__name__)
-    _client: Optional[boto3.client] = None
     _name: Optional[str] = None
+    # which columns are readable is a static property of the model class, so the filtered
+    # list is computed once per class and shared by all actions.  The weak keys let model
+    # classes (e.g. ones defined per-test) be garbage collected normally.
+    _readable_columns_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
     def __init__(self, environment: Environment, boto3: boto3, di: StandardDependencies) -> None:
         """Setup action."""
         self.environment = environment
         self.boto3 = boto3
         self.di = di
+        self._clients: dict = {}
+        self._default_region: Optional[str] = None
+        self._has_default_region = False
 
     def configure(
         self,
         message_callable: Optional[Callable] = None,
         when: Optional[Callable] = None,
         assume_role: Optional[AssumeRole] = None,
+        message_callable_returns: str = "auto",
     ) -> None:
         """Configues the Action."""
         self.when = when
@@ -50,69 +74,210 @@ class ActionAws(ABC):
         if not self.environment.get('AWS_REGION', True) and not self.environment.get('AWS_DEFAULT_REGION', True):
             raise ValueError("You must set either the AWS_REGION or AWS_DEFAULT_REGION environment variable when using AWS actions")
 
+        # bind the when filter once: None when unconfigured, a direct call for trivial
+        # single-argument callables, and the DI path otherwise
+        self._when_resolver = self._bind_model_callable(when) if when else None
+
+        if message_callable_returns not in ("auto", "str", "dict"):
+            raise ValueError(
+                f"'message_callable_returns' must be one of 'auto', 'str', or 'dict', but '{message_callable_returns}' was provided."
+            )
+        if message_callable_returns != "auto" and not message_callable:
+            raise ValueError("'message_callable_returns' was provided but 'message_callable' was not.")
+
+        # the message_callable-vs-model-columns branch is fixed once configure runs, so pick
+        # the body builder here instead of re-branching on every send.  When the caller
+        # declares what their callable returns, the per-send type dispatch goes away too:
+        # 'str' passes the return value straight through (e.g. pre-encoded JSON) and 'dict'
+        # skips right to serialization.
+        if message_callable:
+            self._message_callable_binding = self._bind_model_callable(message_callable)
+            if message_callable_returns == "str":
+                self._build_body = self._message_callable_binding
+            elif message_callable_returns == "dict":
+                self._build_body = self._build_body_from_callable_dict
+            else:
+                self._build_body = self._build_body_from_callable
+        else:
+            self._message_callable_binding = None
+            self._build_body = self._build_body_from_model
+
     def __call__(self, model: Models) -> None:
         """Send a notification as configured."""
-        if self.when and not self.di.call_function(self.when, model=model):
+        if self._when_resolver is not None and not self._when_resolver(model):
             return
 
         try:
-            client = self._getClient()
-            self._execute_action(client, model)
-        except ClientError as e:
+            self._execute_action(self._getClient, model)
+        except ClientError:
             self._logging.exception(f"Failed to retrieve client for {self._name}")
-            raise e
+            raise
 
-    def _getClient(self, region=None) -> boto3.client:
-        """Retrieve the boto3 client."""
-        can_cache = not region
-        if self._client and can_cache:
-            return self._client
+    def apply_many(self, models, max_workers: int = 32) -> None:
+        """
+        Apply the action to every model in a collection, fanning the sends out over a
+        bounded thread pool.
 
+        The per-model AWS calls are network-bound and boto3 releases the GIL during I/O,
+        so this scales throughput up to min(max_workers, the AWS rate limit).  The client
+        (and any assume-role call) is resolved once before the fan-out and shared by all
+        workers, since boto3 clients are thread-safe.
+        """
+        if self._when_resolver is not None:
+            models = [model for model in models if self._when_resolver(model)]
+        models = list(models)
+        if not models:
+            return
+
+        self._getClient()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._execute_action, self._getClient, model) for model in models]
+        for future in futures:
+            future.result()
+
+    def _getClient(self, region=None) -> boto3.client:
+        """Retrieve the boto3 client, caching one per requested region."""
+        # assume-role clients carry per-role credentials, so those stay per-instance
+        # and have to follow the role session as it rolls over
         if self.assume_role:
-            boto3 = self.assume_role(self.boto3)
-        else:
-            boto3 = self.boto3
+            return self._get_assume_role_client(region)
 
-        if not region:
-            region = self.default_region()
-        if region:
-            client = boto3.client(self._name, region_name=region)
-        else:
-            client = boto3.client(self._name)
+        client = self._clients.get(region)
+        if client is not None:
+            return client
 
-        if can_cache:
-            self._client = client
+        region_name = region if region else self.default_region()
+
+        try:
+            shared = _shared_clients.setdefault(self.boto3, {})
+        except TypeError:
+            # boto3 stand-ins that don't support weak references just skip sharing
+            shared = None
+        key = (self._name, region_name)
+        client = shared.get(key) if shared is not None else None
+        if client is None:
+            client = self._build_client(self.boto3, region_name)
+            if shared is not None:
+                shared[key] = client
+
+        self._clients[region] = client
+        return client
+
+    def _get_assume_role_client(self, region=None) -> boto3.client:
+        """
+        Retrieve the client for an assume-role action, rebuilding it when the role
+        session rolls over.
+
+        The assume-role call caches its session until the STS credentials near expiry,
+        so invoking it on every send is cheap.  Comparing the session it returns with
+        the one the cached client was built from is what lets a long-lived process
+        (a warm lambda container, a worker loop) pick up fresh credentials instead of
+        failing with ExpiredTokenException once the old ones lapse.
+        """
+        session = self.assume_role(self.boto3)
+        cached = self._clients.get(region)
+        if cached is not None and cached[1] is session:
+            return cached[0]
+
+        region_name = region if region else self.default_region()
+        client = self._build_client(session, region_name)
+        self._clients[region] = (client, session)
         return client
 
+    def _build_client(self, boto3, region_name: Optional[str]) -> boto3.client:
+        if region_name:
+            return boto3.client(self._name, region_name=region_name, config=CLIENT_CONFIG)
+        return boto3.client(self._name, config=CLIENT_CONFIG)
+
     def default_region(self):
+        if self._has_default_region:
+            return self._default_region
         region = self.environment.get('AWS_REGION', silent=True)
-        if region:
-            return region
-        region = self.environment.get('DEFAULT_AWS_REGION', silent=True)
-        if region:
-            return region
-        return None
-
-    def _execute_action(self, client: boto3.client, model: Models) -> None:
-        """Run the action."""
+        if not region:
+            region = self.environment.get('DEFAULT_AWS_REGION', silent=True)
+        self._default_region = region if region else None
+        self._has_default_region = True
+        return self._default_region
+
+    def _bind_model_callable(self, user_callable: Callable) -> Callable:
+        """
+        Return a `model -> result` binding for a user-supplied callable.
+
+        Most user callables only declare a `model` parameter, in which case routing them
+        through the DI resolver just pays for signature introspection on every send.  Those
+        get a direct binding; anything with extra parameters keeps the DI path so other
+        dependencies can still be injected.
+        """
+        try:
+            parameters = inspect.signature(user_callable).parameters
+        except (TypeError, ValueError):
+            parameters = None
+        if parameters is not None and set(parameters) == {"model"}:
+            return lambda model: user_callable(model=model)
+        return lambda model: self.di.call_function(user_callable, model=model)
+
+    def _execute_action(self, get_client: Callable, model: Models) -> None:
+        """
+        Run the action.
+
+        `get_client` is a zero-argument callable that returns the boto3 client.  It is passed
+        in lazily so that actions which decide not to send anything never pay for client
+        construction (or an assume-role call) at all.
+        """
         pass
 
     def get_message_body(self, model: Models) -> str:
         """Retrieve the message for the action."""
-        if self.message_callable:
-            result = self.di.call_function(self.message_callable, model=model)
-            if isinstance(result, dict) or isinstance(result, list):
-                return json.dumps(result, default=string.datetime_to_iso)
-            if not isinstance(result, str):
-                raise TypeError(
-                    f"The return value from the message callable for the {__name__} action must be a string, dictionary, or list. I received a "
-                    + f"{type(result)} after calling '{self.message_callable.__name__}'"
-                )
-            return result
-
-        model_data = OrderedDict()
-        for (column_name, column) in model.columns().items():
-            if not column.is_readable:
-                continue
-            model_data.update(column.to_json(model))
-        return json.dumps(model_data, default=string.datetime_to_iso)
+        return self._build_body(model)
+
+    def _build_body_from_callable(self, model: Models) -> str:
+        result = self._message_callable_binding(model)
+        if isinstance(result, (dict, list)):
+            # orjson serializes datetimes natively, so when it is available we can skip
+            # the per-value python-level default= callback entirely
+            if orjson is not None:
+                return orjson.dumps(result).decode("utf-8")
+            return json.dumps(result, separators=(",", ":"), default=string.datetime_to_iso)
+        if not isinstance(result, str):
+            raise TypeError(
+                f"The return value from the message callable for the {__name__} action must be a string, dictionary, or list. I received a "
+                + f"{type(result)} after calling '{self.message_callable.__name__}'"
+            )
+        return result
+
+    def _build_body_from_callable_dict(self, model: Models) -> str:
+        result = self._message_callable_binding(model)
+        if orjson is not None:
+            return orjson.dumps(result).decode("utf-8")
+        return json.dumps(result, separators=(",", ":"), default=string.datetime_to_iso)
+
+    def _build_body_from_model(self, model: Models) -> str:
+        model_data = {
+            key: value
+            for (column_name, column) in self._readable_columns(model)
+            for (key, value) in column.to_json(model).items()
+        }
+        if orjson is not None:
+            try:
+                return orjson.dumps(model_data).decode("utf-8")
+            except TypeError:
+                # columns can emit types orjson doesn't know; fall back to the stdlib path
+                pass
+        # compact separators keep the output byte-identical to the orjson path
+        return json.dumps(model_data, separators=(",", ":"), default=string.datetime_to_iso)
+
+    def _readable_columns(self, model: Models) -> tuple:
+        """Return the (column_name, column) pairs for the readable columns of the model's class."""
+        model_class = model.__class__
+        readable = self._readable_columns_cache.get(model_class)
+        if readable is None:
+            # interning the column names makes the dict keys in the message body compare by
+            # pointer on the hash-collision path, since the same small pool of names is
+            # reused for every message
+            readable = tuple(
+                (sys.intern(column_name), column)
+                for (column_name, column) in model.columns().items()
+                if column.is_readable
+            )
+            self._readable_columns_cache[model_class] = readable
+        return readable
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import time
 from types import ModuleType
 from typing import Optional
 class AssumeRole:
@@ -59,11 +60,15 @@ class AssumeRole:
                     ])
 
     """
-    role_arn = ""
-    external_id = ""
-    role_session_name = ""
-    duration = 3600
-    source: Optional[AssumeRole] = None
+    __slots__ = (
+        "role_arn",
+        "external_id",
+        "role_session_name",
+        "duration",
+        "source",
+        "_cached_session",
+        "_expires_at",
+    )
 
     def __init__(
         self,
@@ -79,8 +84,15 @@ class AssumeRole:
         self.role_session_name = role_session_name
         self.duration = duration
         self.source = source
+        self._cached_session: Optional[ModuleType] = None
+        self._expires_at = 0.0
 
     def __call__(self, boto3: ModuleType) -> ModuleType:
+        # sts:AssumeRole is a live network call, so reuse the session until the credentials
+        # are close to expiring (with a 60 second buffer to avoid mid-request failures).
+        if self._cached_session is not None and time.monotonic() < self._expires_at - 60:
+            return self._cached_session
+
         # chaining!
         if self.source:
             boto3 = self.source(boto3)
@@ -95,8 +107,10 @@ class AssumeRole:
         credentials = boto3.client("sts").assume_role(**calling_params)["Credentials"]
 
         # now let's make a new session using those
-        return boto3.Session(
+        self._cached_session = boto3.Session(
             aws_access_key_id=credentials["AccessKeyId"],
             aws_secret_access_key=credentials["SecretAccessKey"],
             aws_session_token=credentials["SessionToken"],
         )
+        self._expires_at = time.monotonic() + self.duration
+        return self._cached_session
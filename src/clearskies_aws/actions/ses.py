@@ -1,17 +1,94 @@
 import boto3
 import clearskies
 import datetime
+import hashlib
+import os
+import stat
+import tempfile
+
+try:
+    import jinja2
+except ImportError:
+    # jinja is an optional dependency, installed via the 'ses' extra; we only complain
+    # if someone actually configures a template
+    jinja2 = None  # type: ignore
 
 from botocore.exceptions import ClientError
 from clearskies.environment import Environment
 from clearskies.models import Models
-from collections.abc import Sequence
 from typing import Any, Callable, List, Optional, Union
-from types import ModuleType
 
 from ..di import StandardDependencies
 from .assume_role import AssumeRole
 from .action_aws import ActionAws
+
+# names of SES templates we have already created for bulk sends, keyed by (subject, message)
+_bulk_template_names: dict = {}
+
+# compiled inline templates, keyed by template source.  Compiling a template is
+# expensive, so when many actions share a handful of templates each one is compiled
+# exactly once per process.  File templates are cached by the jinja environment itself.
+_template_cache: dict = {}
+
+# one shared jinja environment for all SES actions, built lazily since jinja is an
+# optional dependency
+_jinja_environment = None
+
+def _get_jinja_environment():
+    global _jinja_environment
+    if _jinja_environment is None:
+        if jinja2 is None:
+            raise ImportError(
+                "jinja2 is required to use SES templates.  Install clear-skies-aws with the 'ses' extra to get it."
+            )
+        _jinja_environment = jinja2.Environment(
+            loader=jinja2.FunctionLoader(_read_template_file),
+            bytecode_cache=_jinja_bytecode_cache(),
+            auto_reload=False,
+        )
+    return _jinja_environment
+
+def _jinja_bytecode_cache():
+    """
+    Build the on-disk bytecode cache that persists compiled templates across processes,
+    which matters for lambda cold starts.
+
+    Jinja loads these cache files with marshal, which executes whatever bytecode it
+    finds, so the cache directory has to be private to us: a shared directory under
+    /tmp would let any local user plant a cache file for us to execute.  We use a
+    per-user directory created with mode 0o700 and double-check its ownership and
+    permissions; if anything about it looks off (or we can't create it at all), we
+    just skip the cache rather than trust the directory.
+    """
+    try:
+        uid = os.getuid()
+        cache_directory = os.path.join(tempfile.gettempdir(), f"clearskies_aws_jinja_cache_{uid}")
+        os.makedirs(cache_directory, mode=0o700, exist_ok=True)
+        directory_stat = os.lstat(cache_directory)
+        if (
+            not stat.S_ISDIR(directory_stat.st_mode)
+            or directory_stat.st_uid != uid
+            or directory_stat.st_mode & 0o077
+        ):
+            return None
+    except (OSError, AttributeError):
+        # AttributeError covers platforms without os.getuid
+        return None
+    return jinja2.FileSystemBytecodeCache(directory=cache_directory)
+
+def _read_template_file(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as template_file:
+        return template_file.read()
+
+def _compile_template_string(source: str):
+    template = _template_cache.get(source)
+    if template is None:
+        template = _get_jinja_environment().from_string(source)
+        _template_cache[source] = template
+    return template
+
+def _compile_template_file(path: str):
+    return _get_jinja_environment().get_template(path)
 class SES(ActionAws):
     _name = "ses"
 
@@ -44,31 +121,54 @@ class SES(ActionAws):
         }
         # this just moves the data from the various "to" inputs (to, cc, bcc) into the self.destinations
         # dictionary, after normalizing it so that it is always a list.
-        for key in self.destinations.keys():
-            destination_values = locals()[key]
+        for (key, destination_values) in (("to", to), ("cc", cc), ("bcc", bcc)):
             if not destination_values:
                 continue
-            if type(destination_values) == str or callable(destination_values):
+            if isinstance(destination_values, str) or callable(destination_values):
                 self.destinations[key] = [destination_values]
             else:
                 self.destinations[key] = destination_values
+
+        # classify every destination entry once: literal addresses (they contain '@'),
+        # model column names, and callables.  _resolve_destination then just stitches the
+        # pieces together instead of re-sniffing each entry on every send.
+        self._static_addresses = {}
+        self._column_names = {}
+        self._destination_callables = {}
+        for (key, values) in self.destinations.items():
+            self._static_addresses[key] = tuple(value for value in values if not callable(value) and "@" in value)
+            self._column_names[key] = tuple(value for value in values if not callable(value) and "@" not in value)
+            self._destination_callables[key] = tuple(value for value in values if callable(value))
+
+        # when every destination is a literal address the Destination payload never changes
+        # between sends, so build it once; likewise for a literal subject
+        self._static_destination = None
+        if self._static_addresses["to"] and not any(
+            self._column_names[key] or self._destination_callables[key] for key in self.destinations
+        ):
+            self._static_destination = {
+                "ToAddresses": list(self._static_addresses["to"]),
+                "CcAddresses": list(self._static_addresses["cc"]),
+                "BccAddresses": list(self._static_addresses["bcc"]),
+            }
+        self._static_subject = {"Charset": "utf-8", "Data": subject} if subject else None
         self.subject = subject
         self.message = message
         self.sender = sender
         self.subject_template = None
         self.message_template = None
+        # template compilation (and any file read) is deferred to the first send, so that
+        # actions whose 'when' predicate never fires pay no I/O or parse cost at all
+        self._subject_template_source = None
+        self._message_template_source = None
         self.dependencies_for_template = dependencies_for_template if dependencies_for_template else []
+        self._template_variables_cache = None
+        self._message_uses_text_in_html = None
 
         if not to and not cc:
             raise ValueError("You must configure at least one 'to' address or one 'cc' address")
-        num_subjects = 0
-        num_messages = 0
-        for source in [subject, subject_template, subject_template_file]:
-            if source:
-                num_subjects += 1
-        for source in [message, message_template, message_template_file]:
-            if source:
-                num_messages += 1
+        num_subjects = bool(subject) + bool(subject_template) + bool(subject_template_file)
+        num_messages = bool(message) + bool(message_template) + bool(message_template_file)
         if num_subjects > 1:
             raise ValueError(
                 "More than one of 'subject', 'subject_template', or 'subject_template_file' was set, but only one of these may be set."
@@ -79,53 +179,156 @@ class SES(ActionAws):
             )
 
         if subject_template_file:
-            import jinja2
-            with open(subject_template_file, "r", encoding="utf-8") as template:
-                self.subject_template = jinja2.Template(template.read())
+            self._subject_template_source = ("file", subject_template_file)
         elif subject_template:
-            import jinja2
-            self.subject_template = jinja2.Template(subject_template)
+            self._subject_template_source = ("string", subject_template)
 
         if message_template_file:
-            import jinja2
-            with open(message_template_file, "r", encoding="utf-8") as template:
-                self.message_template = jinja2.Template(template.read())
+            self._message_template_source = ("file", message_template_file)
         elif message_template:
-            import jinja2
-            self.message_template = jinja2.Template(message_template)
+            self._message_template_source = ("string", message_template)
 
-    def _execute_action(self, client: ModuleType, model: Models) -> None:
-        """Send a notification as configured."""
-        utcnow = self.di.build('utcnow')
+    def _get_subject_template(self):
+        if self.subject_template is None and self._subject_template_source is not None:
+            self.subject_template = self._compile_template_source(self._subject_template_source)
+        return self.subject_template
 
-        tos = self._resolve_destination("to", model)
-        if not tos:
-            return
-        response = client.send_email(
-            Destination={
+    def _get_message_template(self):
+        if self.message_template is None and self._message_template_source is not None:
+            self.message_template = self._compile_template_source(self._message_template_source)
+        return self.message_template
+
+    def _check_message_uses_text_in_html(self) -> bool:
+        """Check (once) whether the message template references the text_in_html flag."""
+        if self._message_uses_text_in_html is None:
+            (kind, value) = self._message_template_source
+            source = _read_template_file(value) if kind == "file" else value
+            # a substring check can false-positive (e.g. text_in_html in a comment), but
+            # that just means we render twice like we always did
+            self._message_uses_text_in_html = "text_in_html" in source
+        return self._message_uses_text_in_html
+
+    def _compile_template_source(self, source):
+        (kind, value) = source
+        if kind == "file":
+            return _compile_template_file(value)
+        return _compile_template_string(value)
+
+    def _execute_action(self, get_client: Callable, model: Models, utcnow: Optional[datetime.datetime] = None) -> None:
+        """Send a notification as configured."""
+        if self._static_destination is not None:
+            destination = self._static_destination
+        else:
+            tos = self._resolve_destination("to", model)
+            if not tos:
+                return
+            destination = {
                 "ToAddresses": tos,
                 "CcAddresses": self._resolve_destination("cc", model),
                 "BccAddresses": self._resolve_destination("bcc", model),
-            },
+            }
+        # batch drivers share one "now" across the whole batch and pass it in
+        if utcnow is None:
+            utcnow = self.di.build('utcnow')
+        # the template variables are the same for the subject, html, and text renders,
+        # so build them once per send instead of once per render
+        variables = self.more_template_variables()
+        html_message = self._render_message_as_html(model, utcnow, variables)
+        if self._message_template_source and self._check_message_uses_text_in_html():
+            text_message = self._render_message_as_text(model, utcnow, variables)
+        else:
+            # when the template never branches on text_in_html the two renders are
+            # identical, so skip the second one
+            text_message = html_message
+        client = get_client()
+        response = client.send_email(
+            Destination=destination,
             Message={
                 "Body": {
                     "Html": {
                         "Charset": "utf-8",
-                        "Data": self._resolve_message_as_html(model, utcnow),
+                        "Data": html_message,
                     },
                     "Text": {
                         "Charset": "utf-8",
-                        "Data": self._resolve_message_as_text(model, utcnow),
+                        "Data": text_message,
                     },
                 },
-                "Subject": {
+                "Subject": self._static_subject if self._static_subject is not None else {
                     "Charset": "utf-8",
-                    "Data": self._resolve_subject(model, utcnow)
+                    "Data": self._render_subject(model, utcnow, variables)
                 },
             },
             Source=self.sender,
         )
 
+    def send_bulk(self, models, batch_size: int = 50) -> None:
+        """
+        Send the configured email to every model in a collection.
+
+        When the subject and message are static strings the whole batch is coalesced into
+        send_bulk_templated_email calls (up to 50 destinations per API request), using an
+        SES template that we create on the fly and reuse for the life of the process.
+        Jinja-templated content is rendered per-model on our side, so it falls back to one
+        send_email call per model.
+        """
+        if self._when_resolver is not None:
+            models = [model for model in models if self._when_resolver(model)]
+        models = list(models)
+        if not models:
+            return
+
+        if self._subject_template_source or self._message_template_source:
+            utcnow = self.di.build('utcnow')
+            for model in models:
+                self._execute_action(self._getClient, model, utcnow=utcnow)
+            return
+
+        client = self._getClient()
+        template_name = self._ensure_bulk_template(client)
+        destinations = []
+        for model in models:
+            tos = self._resolve_destination("to", model)
+            if not tos:
+                continue
+            destinations.append({
+                "Destination": {
+                    "ToAddresses": tos,
+                    "CcAddresses": self._resolve_destination("cc", model),
+                    "BccAddresses": self._resolve_destination("bcc", model),
+                },
+                "ReplacementTemplateData": "{}",
+            })
+        for start in range(0, len(destinations), batch_size):
+            client.send_bulk_templated_email(
+                Source=self.sender,
+                Template=template_name,
+                DefaultTemplateData="{}",
+                Destinations=destinations[start:start + batch_size],
+            )
+
+    def _ensure_bulk_template(self, client) -> str:
+        """Create (once) and return the name of the SES template for our static content."""
+        content_key = (self.subject if self.subject else "", self.message if self.message else "")
+        template_name = _bulk_template_names.get(content_key)
+        if template_name is not None:
+            return template_name
+
+        digest = hashlib.sha256(("\0".join(content_key)).encode("utf-8")).hexdigest()[:16]
+        template_name = f"clearskies-aws-{digest}"
+        try:
+            client.create_template(Template={
+                "TemplateName": template_name,
+                "SubjectPart": content_key[0],
+                "HtmlPart": content_key[1],
+                "TextPart": content_key[1],
+            })
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "AlreadyExists":
+                raise
+        _bulk_template_names[content_key] = template_name
+        return template_name
+
     def _resolve_destination(self, name: str, model: clearskies.Model) -> List[str]:
         """
         Return a list of to/cc/bcc addresses.
@@ -135,60 +338,79 @@ class SES(ActionAws):
          1. An email address
          2. The name of a column in the model that contains an email address
         """
-        resolved = []
-        destinations = self.destinations[name]
-        for destination in destinations:
-            if callable(destination):
-                more = self.di.call_function(destination, model=model)
-                if not isinstance(more, list):
-                    more = [more]
-                for entry in more:
-                    if not isinstance(entry, str):
-                        raise ValueError(f"I invoked a callable to fetch the '{name}' addresses for model '{model.__class__.__name__}' but it returned something other than a string.  Callables must return a valid email address or a list of email addresses.")
-                    if "@" not in entry:
-                        raise ValueError(f"I invoked a callable to fetch the '{name}' addresses for model '{model.__class__.__name__}' but it returned a non-email address.  Callables must return a valid email address or a list of email addresses.")
-                resolved.extend(more)
-                continue
-            if "@" in destination:
-                resolved.append(destination)
-                continue
-            resolved.append(model.get(destination))
+        # cc/bcc are usually empty, so skip all the work (the common case) entirely
+        if not self.destinations[name]:
+            return []
+        # bind the lookups used in the loops to locals to cut attribute-walk overhead on
+        # large destination lists
+        resolved = list(self._static_addresses[name])
+        model_get = model.get
+        resolved.extend(model_get(column) for column in self._column_names[name])
+        di_call = self.di.call_function
+        for destination in self._destination_callables[name]:
+            more = di_call(destination, model=model)
+            if not isinstance(more, list):
+                more = [more]
+            for entry in more:
+                if not isinstance(entry, str):
+                    raise ValueError(f"I invoked a callable to fetch the '{name}' addresses for model '{model.__class__.__name__}' but it returned something other than a string.  Callables must return a valid email address or a list of email addresses.")
+                if "@" not in entry:
+                    raise ValueError(f"I invoked a callable to fetch the '{name}' addresses for model '{model.__class__.__name__}' but it returned a non-email address.  Callables must return a valid email address or a list of email addresses.")
+            resolved.extend(more)
         return resolved
 
     def _resolve_message_as_html(self, model: clearskies.Model, now: datetime.datetime) -> str:
         """Build the HTML for a message."""
+        return self._render_message_as_html(model, now, self.more_template_variables())
+
+    def _resolve_message_as_text(self, model: clearskies.Model, now: datetime.datetime) -> str:
+        """Build the text for a message."""
+        return self._render_message_as_text(model, now, self.more_template_variables())
+
+    def _resolve_subject(self, model: clearskies.Model, now: datetime.datetime) -> str:
+        """Build the subject for a message."""
+        return self._render_subject(model, now, self.more_template_variables())
+
+    def _render_message_as_html(self, model: clearskies.Model, now: datetime.datetime, variables: dict) -> str:
+        """Build the HTML for a message with pre-computed template variables."""
         if self.message:
             return self.message
 
-        if self.message_template:
-            return str(
-                self.message_template.render(model=model, now=now, **self.more_template_variables(), text_in_html=True)
-            )
+        message_template = self._get_message_template()
+        if message_template:
+            return str(message_template.render(model=model, now=now, **variables, text_in_html=True))
 
         return ""
 
-    def _resolve_message_as_text(self, model: clearskies.Model, now: datetime.datetime) -> str:
-        """Build the text for a message."""
+    def _render_message_as_text(self, model: clearskies.Model, now: datetime.datetime, variables: dict) -> str:
+        """Build the text for a message with pre-computed template variables."""
         if self.message:
             return self.message
 
-        if self.message_template:
-            return str(self.message_template.render(model=model, now=now, **self.more_template_variables()))
+        message_template = self._get_message_template()
+        if message_template:
+            return str(message_template.render(model=model, now=now, **variables))
 
         return ""
 
-    def _resolve_subject(self, model: clearskies.Model, now: datetime.datetime) -> str:
-        """Build the subject for a message."""
+    def _render_subject(self, model: clearskies.Model, now: datetime.datetime, variables: dict) -> str:
+        """Build the subject for a message with pre-computed template variables."""
         if self.subject:
             return self.subject
 
-        if self.subject_template:
-            return str(self.subject_template.render(model=model, now=now, **self.more_template_variables()))
+        subject_template = self._get_subject_template()
+        if subject_template:
+            return str(subject_template.render(model=model, now=now, **variables))
 
         return ""
 
     def more_template_variables(self) -> dict[str, Any]:
-        more_variables = {}
-        for dependency_name in self.dependencies_for_template:
-            more_variables[dependency_name] = self.di.build(dependency_name, cache=True)
-        return more_variables
+        # the dependency list is fixed at configure time and the dependencies themselves
+        # are cached by the DI container, so the whole dict can be built once and reused.
+        # render() unpacks it with **, so callers never mutate the shared copy.
+        if self._template_variables_cache is None:
+            self._template_variables_cache = {
+                dependency_name: self.di.build(dependency_name, cache=True)
+                for dependency_name in self.dependencies_for_template
+            }
+        return self._template_variables_cache
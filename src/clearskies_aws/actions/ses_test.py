@@ -49,6 +49,41 @@ class SESTest(unittest.TestCase):
             ),
         ])
 
+    def test_send_bulk(self):
+        ses = SES(self.environment, self.boto3, self.di)
+        ses.configure(
+            'test@example.com', to='jane@example.com', subject='welcome!', message='hello there'
+        )
+        ses.send_bulk([MagicMock(), MagicMock()])
+        self.ses.create_template.assert_called_once()
+        template_name = self.ses.create_template.call_args.kwargs['Template']['TemplateName']
+        self.ses.send_bulk_templated_email.assert_has_calls([
+            call(
+                Source='test@example.com',
+                Template=template_name,
+                DefaultTemplateData='{}',
+                Destinations=[
+                    {
+                        'Destination': {
+                            'ToAddresses': ['jane@example.com'],
+                            'CcAddresses': [],
+                            'BccAddresses': [],
+                        },
+                        'ReplacementTemplateData': '{}',
+                    },
+                    {
+                        'Destination': {
+                            'ToAddresses': ['jane@example.com'],
+                            'CcAddresses': [],
+                            'BccAddresses': [],
+                        },
+                        'ReplacementTemplateData': '{}',
+                    },
+                ],
+            ),
+        ])
+        self.ses.send_email.assert_not_called()
+
     def test_send_callable(self):
         ses = SES(self.environment, self.boto3, self.di)
         ses.configure(
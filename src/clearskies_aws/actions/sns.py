@@ -1,14 +1,8 @@
 import boto3
-import clearskies
-import datetime
-import json
 
-from botocore.exceptions import ClientError
-from collections.abc import Sequence
 from clearskies.environment import Environment
 from clearskies.models import Models
-from types import ModuleType
-from typing import List, Optional, Callable, cast
+from typing import Optional, Callable
 
 from ..di import StandardDependencies
 from .assume_role import AssumeRole
@@ -35,10 +29,7 @@ class SNS(ActionAws):
         self.topic_environment_key = topic_environment_key
         self.topic_callable = topic_callable
 
-        topics = 0
-        for value in [topic, topic_environment_key, topic_callable]:
-            if value:
-                topics += 1
+        topics = bool(topic) + bool(topic_environment_key) + bool(topic_callable)
         if topics > 1:
             raise ValueError(
                 "You can only provide one of 'topic', 'topic_environment_key', or 'topic_callable', but more than one were provided."
@@ -46,19 +37,30 @@ class SNS(ActionAws):
         if not topics:
             raise ValueError("You must provide at least one of 'topic', 'topic_environment_key', or 'topic_callable'.")
 
-    def _execute_action(self, client: ModuleType, model: Models) -> None:
+        # pick the topic resolution strategy once here rather than re-dispatching per send.
+        # environment lookups are cached after the first send since the environment is immutable.
+        self._environment_topic = None
+        if topic:
+            self._topic_resolver = lambda model: self.topic
+        elif topic_environment_key:
+            self._topic_resolver = self._topic_from_environment
+        else:
+            self._topic_resolver = self._bind_model_callable(topic_callable)
+
+    def _topic_from_environment(self, model: Models) -> str:
+        if self._environment_topic is None:
+            self._environment_topic = self.environment.get(self.topic_environment_key)
+        return self._environment_topic
+
+    def _execute_action(self, get_client: Callable, model: Models) -> None:
         """Send a notification as configured."""
         topic_arn = self.get_topic_arn(model)
         if not topic_arn:
             return
-        client.publish(
-            TopicArn=self.get_topic_arn(model),
+        get_client().publish(
+            TopicArn=topic_arn,
             Message=self.get_message_body(model),
         )
 
     def get_topic_arn(self, model: Models) -> str:
-        if self.topic:
-            return self.topic
-        if self.topic_environment_key:
-            return self.environment.get(self.topic_environment_key)
-        return self.di.call_function(self.topic_callable, model=model)
+        return self._topic_resolver(model)
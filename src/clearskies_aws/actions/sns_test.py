@@ -56,7 +56,7 @@ class SNSTest(unittest.TestCase):
                     "id": "1-2-3-4",
                     "name": "Jane",
                     "email": "jane@example.com",
-                }),
+                }, separators=(",", ":")),
             ),
         ])
         self.assertEqual(id(user), id(self.when))
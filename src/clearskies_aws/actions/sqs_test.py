@@ -54,7 +54,7 @@ class SQSTest(unittest.TestCase):
                     "id": "1-2-3-4",
                     "name": "Jane",
                     "email": "jane@example.com",
-                }),
+                }, separators=(",", ":")),
             ),
         ])
         self.assertEqual(id(user), id(self.when))
@@ -80,7 +80,7 @@ class SQSTest(unittest.TestCase):
                     "id": "1-2-3-4",
                     "name": "Jane",
                     "email": "jane@example.com",
-                }),
+                }, separators=(",", ":")),
             ),
         ])
         self.assertEqual(id(user), id(self.when))
@@ -106,11 +106,71 @@ class SQSTest(unittest.TestCase):
                     "id": "1-2-3-4",
                     "name": "Jane",
                     "email": "jane@example.com",
-                }),
+                }, separators=(",", ":")),
             ),
         ])
         self.assertEqual(id(user), id(self.when))
 
+    def test_message_callable_returns_str(self):
+        sqs = SQS(self.environment, self.boto3, self.di)
+        sqs.configure(
+            queue_url='https://queue.example.com',
+            message_callable=lambda model: '{"already":"json"}',
+            message_callable_returns='str',
+        )
+        user = self.users.model({
+            "id": "1-2-3-4",
+            "name": "Jane",
+            "email": "jane@example.com",
+        })
+        sqs(user)
+        self.sqs.send_message.assert_has_calls([
+            call(
+                QueueUrl='https://queue.example.com',
+                MessageBody='{"already":"json"}',
+            ),
+        ])
+
+    def test_apply_many(self):
+        self.sqs.send_message_batch = MagicMock(return_value={})
+        sqs = SQS(self.environment, self.boto3, self.di)
+        sqs.configure(
+            queue_url='https://queue.example.com',
+        )
+        users = [
+            self.users.model({"id": str(index), "name": "Jane", "email": "jane@example.com"})
+            for index in range(12)
+        ]
+        sqs.apply_many(users)
+        # 12 messages for one queue means one full batch of 10 and one batch of 2
+        self.assertEqual(2, self.sqs.send_message_batch.call_count)
+        first_call = self.sqs.send_message_batch.call_args_list[0].kwargs
+        self.assertEqual('https://queue.example.com', first_call['QueueUrl'])
+        self.assertEqual(10, len(first_call['Entries']))
+        self.assertEqual(2, len(self.sqs.send_message_batch.call_args_list[1].kwargs['Entries']))
+        self.sqs.send_message.assert_not_called()
+
+    def test_assume_role_client_follows_session_rollover(self):
+        session_one = MagicMock()
+        session_two = MagicMock()
+        client_one = MagicMock()
+        client_two = MagicMock()
+        session_one.client = MagicMock(return_value=client_one)
+        session_two.client = MagicMock(return_value=client_two)
+        assume_role = MagicMock(side_effect=[session_one, session_one, session_two])
+        sqs = SQS(self.environment, self.boto3, self.di)
+        sqs.configure(
+            queue_url='https://queue.example.com',
+            assume_role=assume_role,
+        )
+        # same session twice means the cached client is reused, a new session
+        # (credential rollover) means the client is rebuilt
+        self.assertEqual(id(client_one), id(sqs._getClient()))
+        self.assertEqual(id(client_one), id(sqs._getClient()))
+        self.assertEqual(id(client_two), id(sqs._getClient()))
+        self.assertEqual(1, session_one.client.call_count)
+        self.assertEqual(1, session_two.client.call_count)
+
     def test_not_now(self):
         sqs = SQS(self.environment, self.boto3, self.di)
         sqs.configure(
@@ -2,8 +2,7 @@ import boto3
 
 from clearskies.environment import Environment
 from clearskies.models import Models
-from types import ModuleType
-from typing import List, Optional, Callable, cast
+from typing import Optional, Callable
 
 from ..di import StandardDependencies
 from .assume_role import AssumeRole
@@ -32,10 +31,7 @@ class StepFunction(ActionAws):
         self.arn_callable = arn_callable
         self.column_to_store_execution_arn = column_to_store_execution_arn
 
-        arns = 0
-        for value in [arn, arn_environment_key, arn_callable]:
-            if value:
-                arns += 1
+        arns = bool(arn) + bool(arn_environment_key) + bool(arn_callable)
         if arns > 1:
             raise ValueError(
                 "You can only provide one of 'arn', 'arn_environment_key', or 'arn_callable', but more than one was provided."
@@ -43,15 +39,36 @@ class StepFunction(ActionAws):
         if not arns:
             raise ValueError("You must provide at least one of 'arn', 'arn_environment_key', or 'arn_callable'.")
 
-    def _execute_action(self, client: ModuleType, model: Models) -> None:
+        # pick the arn resolution strategy once here rather than re-dispatching per send.
+        # environment lookups are cached after the first send since the environment is immutable.
+        self._environment_arn = None
+        self._arn_regions: dict = {}
+        if arn:
+            self._arn_resolver = lambda model: self.arn
+        elif arn_environment_key:
+            self._arn_resolver = self._arn_from_environment
+        else:
+            self._arn_resolver = self._bind_model_callable(arn_callable)
+
+    def _arn_from_environment(self, model: Models) -> str:
+        if self._environment_arn is None:
+            self._environment_arn = self.environment.get(self.arn_environment_key)
+        return self._environment_arn
+
+    def _execute_action(self, get_client: Callable, model: Models) -> None:
         """Send a notification as configured."""
         arn = self.get_arn(model)
+        client = get_client()
         default_region = self.default_region()
-        arn_region = arn.split(':')[3]
+        arn_region = self._arn_regions.get(arn)
+        if arn_region is None:
+            # stop splitting after the region field rather than parsing the whole arn
+            arn_region = arn.split(':', 4)[3]
+            self._arn_regions[arn] = arn_region
         if default_region and default_region != arn_region:
             client = self._getClient(region=arn_region)
         response = client.start_execution(
-            stateMachineArn=self.get_arn(model),
+            stateMachineArn=arn,
             input=self.get_message_body(model),
         )
 
@@ -59,8 +76,4 @@ class StepFunction(ActionAws):
             model.save({self.column_to_store_execution_arn: response['executionArn']})
 
     def get_arn(self, model: Models) -> str:
-        if self.arn:
-            return self.arn
-        if self.arn_environment_key:
-            return self.environment.get(self.arn_environment_key)
-        return self.di.call_function(self.arn_callable, model=model)
+        return self._arn_resolver(model)
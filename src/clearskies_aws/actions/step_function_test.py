@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import MagicMock, call
+from .action_aws import CLIENT_CONFIG
 from .step_function import StepFunction
 import clearskies
 from ..di import StandardDependencies
@@ -55,7 +56,7 @@ class StepFunctionTest(unittest.TestCase):
                     "id": self.user.id,
                     "email": self.user.email,
                     "execution_arn": None,
-                }),
+                }, separators=(",", ":")),
             ),
         ])
         self.assertEqual(id(self.user), id(self.when))
@@ -77,14 +78,14 @@ class StepFunctionTest(unittest.TestCase):
                     "id": self.user.id,
                     "email": self.user.email,
                     "execution_arn": None,
-                }),
+                }, separators=(",", ":")),
             ),
         ])
         self.assertEqual(id(self.user), id(self.when))
         self.assertEqual("aws:arn:execution", self.user.execution_arn)
         self.boto3.client.assert_has_calls([
-            call("stepfunctions", region_name="us-east-2"),
-            call("stepfunctions", region_name="eu-west-1"),
+            call("stepfunctions", region_name="us-east-2", config=CLIENT_CONFIG),
+            call("stepfunctions", region_name="eu-west-1", config=CLIENT_CONFIG),
         ])
 
     def test_not_now(self):
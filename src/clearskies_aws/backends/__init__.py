@@ -1,7 +1,21 @@
-from .dynamo_db_backend import DynamoDBBackend
-from .dynamo_db_parti_ql_backend import DynamoDBPartiQLBackend, DynamoDBPartiQLCursor
-from .dynamo_db_condition_parser import DynamoDBConditionParser
-from .sqs_backend import SqsBackend
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .dynamo_db_backend import DynamoDBBackend
+    from .dynamo_db_parti_ql_backend import DynamoDBPartiQLBackend, DynamoDBPartiQLCursor
+    from .dynamo_db_condition_parser import DynamoDBConditionParser
+    from .sqs_backend import SqsBackend
+
+# map each export to its submodule so we only import what actually gets used (PEP 562).
+# the DynamoDB submodules pull in the full service model, which is a meaningful chunk of
+# Lambda cold-start when an application only needs, say, SqsBackend.
+_exports = {
+    "DynamoDBBackend": ".dynamo_db_backend",
+    "DynamoDBPartiQLBackend": ".dynamo_db_parti_ql_backend",
+    "DynamoDBPartiQLCursor": ".dynamo_db_parti_ql_backend",
+    "DynamoDBConditionParser": ".dynamo_db_condition_parser",
+    "SqsBackend": ".sqs_backend",
+}
 
 __all__ = [
     "DynamoDBBackend",
@@ -10,3 +24,15 @@ __all__ = [
     "DynamoDBPartiQLCursor",
     "DynamoDBConditionParser",
 ]
+
+def __getattr__(name: str):
+    module_name = _exports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -183,7 +183,7 @@ class DynamoDBBackend(Backend):
                 model: model.Model,
                 next_page_data: Dict[str, str] = None) -> List[Dict[str, Any]]:
         response = self._dynamodb_query(configuration, model, 'ALL_ATTRIBUTES')
-        if 'LastEvaluatedKey' in response and response['LastEvaluatedKey'] is not None and type(next_page_data) == dict:
+        if 'LastEvaluatedKey' in response and response['LastEvaluatedKey'] is not None and isinstance(next_page_data, dict):
             next_page_data['next_token'] = self.serialize_next_token_for_response(
                 self._map_from_boto3(response['LastEvaluatedKey'])
             )
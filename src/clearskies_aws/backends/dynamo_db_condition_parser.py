@@ -1,8 +1,8 @@
-import base64
-import json
 import logging
-from decimal import Decimal, DecimalException
-from typing import Any, Dict, List, Tuple
+import re
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Any, Dict, List
 
 from clearskies import ConditionParser
 
@@ -12,6 +12,261 @@ from types_boto3_dynamodb.type_defs import AttributeValueTypeDef
 
 logger = logging.getLogger(__name__)
 
+# The operator tables live at module level as frozen constants: the hot paths read them
+# without a per-access attribute lookup on the instance, and nothing can mutate them out
+# from under the compiled regex and derived tables below.  The class exposes them under
+# their original names for API compatibility.
+_OPERATORS = (
+    # Longer operators first to help with matching
+    "is not null",
+    "is not missing",
+    "is null",
+    "is missing",
+    "begins_with",
+    "contains",
+    "<>",
+    "!=",
+    "<=",
+    ">=",
+    "is not",
+    "is",
+    "like",
+    ">",
+    "<",
+    "=",
+    "in",
+)
+_OPERATORS_FOR_MATCHING = MappingProxyType({
+    "like": " like ",
+    "in": " in ",
+    "is not missing": " is not missing",
+    "is missing": " is missing",
+    "is not null": " is not null",
+    "is null": " is null",
+    "is": " is ",
+    "is not": " is not ",
+    "begins_with": " begins_with",
+    "contains": " contains",
+})
+# Derived from the matching table (falling back to the operator itself) so the two can
+# never drift apart.  Not used on the parse hot path, which works from the regex match
+# span, but kept as part of the public tables.
+_OPERATOR_LENGTHS = MappingProxyType({
+    operator: len(_OPERATORS_FOR_MATCHING.get(operator, operator)) for operator in _OPERATORS
+})
+_OPERATORS_WITH_SIMPLE_PLACEHOLDERS = MappingProxyType({
+    "<>": True,
+    "<=": True,
+    ">=": True,
+    "!=": True,
+    "=": True,
+    "<": True,
+    ">": True,
+    "is": True,
+    "is not": True,
+})
+_OPERATORS_WITHOUT_PLACEHOLDERS = frozenset({
+    "is not missing",
+    "is missing",
+})
+_OPERATOR_NEEDS_REMAP = MappingProxyType({
+    "is not null": "is not missing",
+    "is null": "is missing",
+})
+_OPERATORS_WITH_SPECIAL_PLACEHOLDERS = frozenset({"begins_with", "contains"})
+
+# Operator detection happens in one pass with a compiled alternation instead of one
+# str.index scan per operator.  Longest patterns come first in the alternation so a
+# match at a given index prefers the longest operator, preserving the original
+# leftmost-then-longest tie-break.
+_PATTERN_TO_OPERATOR = {
+    _OPERATORS_FOR_MATCHING.get(operator, operator): operator for operator in _OPERATORS
+}
+_OPERATOR_RE = re.compile(
+    "|".join(map(re.escape, sorted(_PATTERN_TO_OPERATOR, key=len, reverse=True)))
+)
+
+# strips both quote styles from column names in a single C-level pass
+_QUOTE_STRIP = str.maketrans("", "", '"`')
+
+# tokens for IN-list parsing: a quoted chunk, an item separator, or a run of plain text.
+# Unpaired quote characters match no alternative and are dropped.  This differs from the
+# old scanner on malformed input: it treated everything after an unpaired quote as quoted
+# and stopped splitting on commas, while this tokenizer keeps splitting.  Well-formed
+# lists parse identically either way.
+_LIST_TOKEN_RE = re.compile(r"""'[^']*'|"[^"]*"|,|[^,'"]+""")
+
+# precomputed "?, ?, ..." strings for the common IN-list sizes
+_PLACEHOLDER_STRINGS = tuple(", ".join(["?"] * (count + 1)) for count in range(64))
+
+
+# shared singletons for the boolean/null conversions; callers treat attribute values as
+# read-only, so handing out the same dict saves an allocation per conversion
+_BOOL_TRUE: AttributeValueTypeDef = {"BOOL": True}
+_BOOL_FALSE: AttributeValueTypeDef = {"BOOL": False}
+_NULL: AttributeValueTypeDef = {"NULL": True}
+
+_BOOL_NULL_STRINGS: Dict[str, AttributeValueTypeDef] = {
+    "true": _BOOL_TRUE,
+    "false": _BOOL_FALSE,
+    "null": _NULL,
+}
+
+# decides up front whether a string is worth handing to Decimal, so the common
+# non-numeric path never pays for a raised-and-caught exception.  re.ASCII keeps \d
+# from matching unicode digits, which DynamoDB rejects in N values
+_NUMERIC_RE = re.compile(r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?\Z", re.ASCII)
+
+# plain integers get spotted in one scan instead of isdigit + startswith + isdigit
+_INTEGER_RE = re.compile(r"-?\d+\Z", re.ASCII)
+
+
+def _string_to_attribute_value(value: str) -> AttributeValueTypeDef:
+    special = _BOOL_NULL_STRINGS.get(value.lower())
+    if special is not None:
+        return special
+    if _NUMERIC_RE.match(value):
+        if _INTEGER_RE.match(value):
+            # skip the int() round-trip when the string is already in canonical form
+            if value[0] == "-":
+                canonical = len(value) > 1 and value[1] != "0"
+            else:
+                canonical = value == "0" or value[0] != "0"
+            return {"N": value if canonical else str(int(value))}
+        return {"N": str(Decimal(value))}
+    return {"S": value}
+
+
+def _bool_to_attribute_value(value: bool) -> AttributeValueTypeDef:
+    return _BOOL_TRUE if value else _BOOL_FALSE
+
+
+def _number_to_attribute_value(value: Any) -> AttributeValueTypeDef:
+    return {"N": str(value)}
+
+
+def _none_to_attribute_value(value: None) -> AttributeValueTypeDef:
+    return _NULL
+
+
+def _bytes_to_attribute_value(value: bytes) -> AttributeValueTypeDef:
+    # boto3 accepts raw bytes for B and handles the wire encoding itself, so there is no
+    # need to pay for a base64 copy plus a decode pass here
+    return {"B": value}
+
+
+def _list_to_attribute_value(value: list) -> AttributeValueTypeDef:
+    # Each item will be AttributeValueTypeDef, so the list is List[AttributeValueTypeDef]
+    return {"L": [_to_attribute_value(item) for item in value]}
+
+
+def _dict_to_attribute_value(value: dict) -> AttributeValueTypeDef:
+    # Each value in the map will be AttributeValueTypeDef
+    return {"M": {str(k): _to_attribute_value(v) for k, v in value.items()}}
+
+
+def _set_to_attribute_value(value: set) -> AttributeValueTypeDef:
+    if not value:
+        raise ValueError("Cannot determine DynamoDB Set type from an empty Python set.")
+    if all(isinstance(item, str) for item in value):
+        return {"SS": sorted(list(value))}
+    elif all(isinstance(item, (int, float, Decimal)) for item in value):
+        return {"NS": sorted([str(item) for item in value])}
+    elif all(isinstance(item, bytes) for item in value):
+        return {"BS": sorted(value)}
+    raise ValueError("Set contains mixed types or unsupported types for DynamoDB Sets.")
+
+
+# exact-type dispatch: one dict lookup on type(value) replaces the isinstance ladder on
+# the hot path.  bool is listed explicitly so it never falls into the number handler.
+_ATTRIBUTE_VALUE_DISPATCH: Dict[type, Any] = {
+    str: _string_to_attribute_value,
+    bool: _bool_to_attribute_value,
+    int: _number_to_attribute_value,
+    float: _number_to_attribute_value,
+    Decimal: _number_to_attribute_value,
+    type(None): _none_to_attribute_value,
+    bytes: _bytes_to_attribute_value,
+    list: _list_to_attribute_value,
+    dict: _dict_to_attribute_value,
+    set: _set_to_attribute_value,
+}
+
+
+def _to_attribute_value_lenient(value: Any) -> AttributeValueTypeDef:
+    try:
+        return _to_attribute_value(value)
+    except (TypeError, ValueError):
+        # structured conditions historically coerced unknown types with str(), so the
+        # direct-build path keeps doing the same rather than rejecting them
+        return {"S": str(value)}
+
+
+def _split_column(column: str) -> tuple:
+    """Splits an optionally table-prefixed column into quote-stripped parts."""
+    if "." in column:
+        table_prefix, column_name_part = column.split(".", 1)
+        return (
+            table_prefix.strip().translate(_QUOTE_STRIP),
+            column_name_part.strip().translate(_QUOTE_STRIP),
+        )
+    return "", column.translate(_QUOTE_STRIP)
+
+
+def _build_parsed_fragment(
+    table_name: str, column_name: str, matching_operator: str, parameter_count: int
+) -> tuple:
+    """
+    Builds the quoted SQL fragment for an already-classified operator, returning
+    (parsed fragment, uppercased operator).  Column parts must be quote-stripped.
+    """
+    if table_name:
+        quoted_column = f'"{table_name}"."{column_name}"'
+    else:
+        quoted_column = f'"{column_name}"'
+    upper_operator = matching_operator.upper()
+
+    if matching_operator in _OPERATORS_WITH_SIMPLE_PLACEHOLDERS:
+        parsed = f"{quoted_column} {upper_operator} ?"
+    elif matching_operator in _OPERATORS_WITHOUT_PLACEHOLDERS:
+        parsed = f"{quoted_column} {upper_operator}"
+    elif matching_operator in _OPERATORS_WITH_SPECIAL_PLACEHOLDERS:
+        parsed = f"{matching_operator}({quoted_column}, ?)"
+    elif matching_operator == "in":
+        placeholders_str = (
+            _PLACEHOLDER_STRINGS[parameter_count - 1]
+            if 0 < parameter_count <= len(_PLACEHOLDER_STRINGS)
+            else ", ".join(["?"] * parameter_count)
+        )
+        parsed = f"{quoted_column} IN ({placeholders_str})"
+    else:
+        raise ValueError(
+            f"Unsupported operator for placeholder generation: {matching_operator}"
+        )
+    return parsed, upper_operator
+
+
+def _to_attribute_value(value: Any) -> AttributeValueTypeDef:
+    handler = _ATTRIBUTE_VALUE_DISPATCH.get(type(value))
+    if handler is not None:
+        return handler(value)
+    # isinstance fallback for subclasses; bool must stay ahead of int here too
+    if isinstance(value, str):
+        return _string_to_attribute_value(value)
+    if isinstance(value, bool):
+        return _bool_to_attribute_value(value)
+    if isinstance(value, (int, float, Decimal)):
+        return _number_to_attribute_value(value)
+    if isinstance(value, bytes):
+        return _bytes_to_attribute_value(value)
+    if isinstance(value, list):
+        return _list_to_attribute_value(value)
+    if isinstance(value, dict):
+        return _dict_to_attribute_value(value)
+    if isinstance(value, set):
+        return _set_to_attribute_value(value)
+    raise TypeError(f"Unsupported Python type for DynamoDB conversion: {type(value)}")
+
 
 class DynamoDBConditionParser(ConditionParser):
     """
@@ -22,77 +277,24 @@ class DynamoDBConditionParser(ConditionParser):
     to convert Python values into the DynamoDB AttributeValue format.
     """
 
-    operator_lengths: Dict[str, int] = {
-        "<>": 2,
-        "<=": 2,
-        ">=": 2,
-        "!=": 2,
-        ">": 1,
-        "<": 1,
-        "=": 1,
-        "in": 4,
-        "is not null": 12,
-        "is null": 8,
-        "is not": 8,
-        "is": 4,
-        "like": 6,
-        "is not missing": 15,
-        "is missing": 11,
-        "contains": 9,
-        "begins_with": 12,
-    }
-    operators: List[str] = [
-        # Longer operators first to help with matching
-        "is not null",
-        "is not missing",
-        "is null",
-        "is missing",
-        "begins_with",
-        "contains",
-        "<>",
-        "!=",
-        "<=",
-        ">=",
-        "is not",
-        "is",
-        "like",
-        ">",
-        "<",
-        "=",
-        "in",
-    ]
-    operators_for_matching: Dict[str, str] = {
-        "like": " like ",
-        "in": " in ",
-        "is not missing": " is not missing",
-        "is missing": " is missing",
-        "is not null": " is not null",
-        "is null": " is null",
-        "is": " is ",
-        "is not": " is not ",
-        "begins_with": " begins_with",
-        "contains": " contains",
-    }
-    operators_with_simple_placeholders: Dict[str, bool] = {
-        "<>": True,
-        "<=": True,
-        ">=": True,
-        "!=": True,
-        "=": True,
-        "<": True,
-        ">": True,
-        "is": True,
-        "is not": True,
-    }
-    operators_without_placeholders: set[str] = {
-        "is not missing",
-        "is missing",
-    }
-    operator_needs_remap: Dict[str, str] = {
-        "is not null": "is not missing",
-        "is null": "is missing",
-    }
-    operators_with_special_placeholders: set[str] = {"begins_with", "contains"}
+    # thin references to the frozen module-level tables, kept for API compatibility
+    operators = _OPERATORS
+    operators_for_matching = _OPERATORS_FOR_MATCHING
+    operator_lengths = _OPERATOR_LENGTHS
+    operators_with_simple_placeholders = _OPERATORS_WITH_SIMPLE_PLACEHOLDERS
+    operators_without_placeholders = _OPERATORS_WITHOUT_PLACEHOLDERS
+    operator_needs_remap = _OPERATOR_NEEDS_REMAP
+    operators_with_special_placeholders = _OPERATORS_WITH_SPECIAL_PLACEHOLDERS
+    _pattern_to_operator = _PATTERN_TO_OPERATOR
+    _operator_re = _OPERATOR_RE
+
+    # parse_condition results are cached per raw condition string; cap the cache so a
+    # stream of unique conditions can't grow it without bound
+    _parse_cache_max_size: int = 1024
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._parse_cache: Dict[str, Dict[str, Any]] = {}
 
     def parse_condition(self, condition: str) -> Dict[str, Any]:
         """
@@ -100,6 +302,9 @@ class DynamoDBConditionParser(ConditionParser):
 
         The "values" key in the returned dictionary will contain List[AttributeValueTypeDef].
 
+        Results are cached per condition string, since applications tend to reissue the
+        same WHERE fragments; a cache hit skips all tokenization and value conversion.
+
         Args:
             condition: The condition string to parse.
 
@@ -107,106 +312,157 @@ class DynamoDBConditionParser(ConditionParser):
             A dictionary with keys: "table", "column", "operator", "values" (DynamoDB formatted),
             and "parsed" (the SQL fragment).
         """
+        cached = self._parse_cache.get(condition)
+        if cached is not None:
+            # fresh top-level dict and values list so callers can't corrupt the cache
+            return {**cached, "values": list(cached["values"])}
+
+        result = self._parse_condition_uncached(condition)
+        if len(self._parse_cache) >= self._parse_cache_max_size:
+            self._parse_cache.clear()
+        self._parse_cache[condition] = result
+        return {**result, "values": list(result["values"])}
+
+    def _parse_condition_uncached(self, condition: str) -> Dict[str, Any]:
         lowercase_condition: str = condition.lower()
-        matching_operator: str = ""
-        matching_index: int = -1
-        current_best_match_len: int = 0
-
-        for operator in self.operators:
-            try:
-                operator_for_match: str = self.operators_for_matching.get(
-                    operator, operator
-                )
-                index: int = lowercase_condition.index(operator_for_match)
-
-                if matching_index == -1 or index < matching_index:
-                    matching_index = index
-                    matching_operator = operator
-                    current_best_match_len = len(operator_for_match)
-                elif index == matching_index:
-                    if len(operator_for_match) > current_best_match_len:
-                        matching_operator = operator
-                        current_best_match_len = len(operator_for_match)
-            except ValueError:
-                continue
-
-        if not matching_operator:
+        match = _OPERATOR_RE.search(lowercase_condition)
+        if match is None:
             raise ValueError(f"No supported operators found in condition {condition}")
+        matching_operator: str = _PATTERN_TO_OPERATOR[match.group()]
 
-        column: str = condition[:matching_index].strip()
-        value: str = condition[
-            matching_index + self.operator_lengths[matching_operator] :
-        ].strip()
+        column: str = condition[: match.start()].strip()
 
-        if len(value) >= 2:
-            first_char = value[0]
-            last_char = value[-1]
-            if (first_char == "'" and last_char == "'") or (
-                first_char == '"' and last_char == '"'
-            ):
-                value = value[1:-1]
+        # remap first (is null -> is missing, etc) so no-placeholder operators can skip
+        # the value extraction, quote stripping, and conversion below entirely.
+        # matching_operator is already canonical lowercase from the detection table.
+        matching_operator = _OPERATOR_NEEDS_REMAP.get(matching_operator, matching_operator)
 
         raw_values: List[str] = []
+        if matching_operator not in _OPERATORS_WITHOUT_PLACEHOLDERS:
+            value: str = condition[match.end() :].strip()
+            if len(value) >= 2:
+                first_char = value[0]
+                last_char = value[-1]
+                if (first_char == "'" and last_char == "'") or (
+                    first_char == '"' and last_char == '"'
+                ):
+                    value = value[1:-1]
+
+            if matching_operator == "in":
+                raw_values = self._parse_condition_list(value) if value else []
+            elif matching_operator == "like":
+                # classify the wildcard shape once: bit 1 = leading %, bit 0 = trailing %
+                wildcards = ((value[:1] == "%") << 1) | (value[-1:] == "%")
+                if wildcards == 0b11 and len(value) > 1:
+                    matching_operator = "contains"
+                    raw_values = [value[1:-1]]
+                elif wildcards == 0b01:
+                    matching_operator = "begins_with"
+                    raw_values = [value[:-1]]
+                elif wildcards == 0b10:
+                    raise ValueError(
+                        "DynamoDB PartiQL does not directly support 'ends_with'"
+                    )
+                else:
+                    matching_operator = "="
+                    raw_values = [value]
+            else:
+                raw_values = [value]
+
+        table_name, final_column_name = _split_column(column)
+
+        # This list will now correctly be List[AttributeValueTypeDef]
+        parameters: List[AttributeValueTypeDef] = [
+            _to_attribute_value(val_item) for val_item in raw_values
+        ]
+
+        # The column parts are already quote-stripped and the operator already
+        # classified, so routing through _with_placeholders would redo the split,
+        # strip, and table lookups.  _with_placeholders stays as-is for external
+        # callers.
+        parsed, upper_operator = _build_parsed_fragment(
+            table_name, final_column_name, matching_operator, len(parameters)
+        )
+
+        return {
+            "table": table_name,
+            "column": final_column_name,
+            "operator": upper_operator,
+            "values": parameters,  # This is now correctly typed for MyPy
+            "parsed": parsed,
+        }
+
+    def build_condition(
+        self, column: str, operator: str, values: List[Any]
+    ) -> Dict[str, Any]:
+        """
+        Builds a parsed condition directly from structured inputs.
 
-        if matching_operator == "in":
-            raw_values = self._parse_condition_list(value) if value else []
-        elif matching_operator not in self.operators_without_placeholders and not (
-            matching_operator in self.operator_needs_remap
-            and self.operator_needs_remap[matching_operator]
-            in self.operators_without_placeholders
-        ):
-            raw_values = [value]
-
-        if matching_operator.lower() == "like":
-            if value.startswith("%") and value.endswith("%") and len(value) > 1:
+        This is the structured twin of parse_condition: callers that already hold the
+        column, operator, and Python values skip the format-into-a-string-then-reparse
+        round trip (and all of its quoting and tokenization) entirely.  The returned
+        dictionary has the same shape as parse_condition's.
+
+        Args:
+            column: The column name, optionally table-prefixed and/or quoted.
+            operator: The condition operator, in any case.
+            values: The Python values for the condition's placeholders.
+
+        Returns:
+            A dictionary with keys: "table", "column", "operator", "values" (DynamoDB
+            formatted), and "parsed" (the SQL fragment).
+        """
+        matching_operator: str = operator.strip().lower()
+        matching_operator = _OPERATOR_NEEDS_REMAP.get(matching_operator, matching_operator)
+
+        if matching_operator in _OPERATORS_WITHOUT_PLACEHOLDERS:
+            condition_values: List[Any] = []
+        elif matching_operator == "in":
+            condition_values = list(values)
+        elif matching_operator == "like":
+            if not values or not isinstance(values[0], str):
+                raise ValueError(
+                    f"The 'like' operator requires a string value for column '{column}'"
+                )
+            value = values[0]
+            # classify the wildcard shape once: bit 1 = leading %, bit 0 = trailing %
+            wildcards = ((value[:1] == "%") << 1) | (value[-1:] == "%")
+            if wildcards == 0b11 and len(value) > 1:
                 matching_operator = "contains"
-                raw_values = [value[1:-1]]
-            elif value.endswith("%") and not value.startswith("%"):
+                condition_values = [value[1:-1]]
+            elif wildcards == 0b01:
                 matching_operator = "begins_with"
-                raw_values = [value[:-1]]
-            elif value.startswith("%") and not value.endswith("%"):
+                condition_values = [value[:-1]]
+            elif wildcards == 0b10:
                 raise ValueError(
                     "DynamoDB PartiQL does not directly support 'ends_with'"
                 )
             else:
                 matching_operator = "="
-                raw_values = [value]
-
-        matching_operator = self.operator_needs_remap.get(
-            matching_operator.lower(), matching_operator
-        )
-
-        table_name: str = ""
-        final_column_name: str = column
-        if "." in column:
-            table_prefix, column_name_part = column.split(".", 1)
-            table_name = table_prefix.strip().replace('"', "").replace("`", "")
-            final_column_name = (
-                column_name_part.strip().replace('"', "").replace("`", "")
-            )
+                condition_values = [value]
         else:
-            final_column_name = column.replace('"', "").replace("`", "")
+            if not values:
+                raise ValueError(
+                    f"Operator '{operator}' requires a value for column '{column}'"
+                )
+            condition_values = [values[0]]
 
-        # This list will now correctly be List[AttributeValueTypeDef]
-        parameters: List[AttributeValueTypeDef] = []
-        if matching_operator.lower() not in self.operators_without_placeholders:
-            for val_item in raw_values:
-                parameters.append(self.to_dynamodb_attribute_value(val_item))
+        table_name, final_column_name = _split_column(column)
+
+        parameters: List[AttributeValueTypeDef] = [
+            _to_attribute_value_lenient(val_item) for val_item in condition_values
+        ]
 
-        column_for_parsed: str = (
-            f"{table_name}.{final_column_name}" if table_name else final_column_name
+        parsed, upper_operator = _build_parsed_fragment(
+            table_name, final_column_name, matching_operator, len(parameters)
         )
 
         return {
             "table": table_name,
             "column": final_column_name,
-            "operator": matching_operator.upper(),
-            "values": parameters,  # This is now correctly typed for MyPy
-            "parsed": self._with_placeholders(
-                column_for_parsed,
-                matching_operator,
-                parameters,
-            ),
+            "operator": upper_operator,
+            "values": parameters,
+            "parsed": parsed,
         }
 
     def _with_placeholders(
@@ -224,31 +480,36 @@ class DynamoDBConditionParser(ConditionParser):
         """
         quoted_column = column
         if escape:
-            parts: List[str] = column.split(".", 1)
-            cleaned_parts: List[str] = [part.strip('"`') for part in parts]
-            if len(cleaned_parts) == 2:
+            # one translate pass strips the quotes, and partition avoids the list that
+            # split would allocate
+            cleaned = column.translate(_QUOTE_STRIP)
+            table_part, dot, column_part = cleaned.partition(".")
+            if dot:
                 quoted_column = (
-                    f"{escape_character}{cleaned_parts[0]}{escape_character}"
+                    f"{escape_character}{table_part}{escape_character}"
                     "."
-                    f"{escape_character}{cleaned_parts[1]}{escape_character}"
+                    f"{escape_character}{column_part}{escape_character}"
                 )
             else:
-                quoted_column = (
-                    f"{escape_character}{cleaned_parts[0]}{escape_character}"
-                )
+                quoted_column = f"{escape_character}{cleaned}{escape_character}"
 
         upper_case_operator: str = operator.upper()
         lower_case_operator: str = operator.lower()
 
-        if lower_case_operator in self.operators_with_simple_placeholders:
+        if lower_case_operator in _OPERATORS_WITH_SIMPLE_PLACEHOLDERS:
             return f"{quoted_column} {upper_case_operator} ?"
-        if lower_case_operator in self.operators_without_placeholders:
+        if lower_case_operator in _OPERATORS_WITHOUT_PLACEHOLDERS:
             return f"{quoted_column} {upper_case_operator}"
-        if lower_case_operator in self.operators_with_special_placeholders:
+        if lower_case_operator in _OPERATORS_WITH_SPECIAL_PLACEHOLDERS:
             return f"{lower_case_operator}({quoted_column}, ?)"
 
         if lower_case_operator == "in":
-            placeholders_str: str = ", ".join(["?" for _ in values])
+            count = len(values)
+            placeholders_str: str = (
+                _PLACEHOLDER_STRINGS[count - 1]
+                if 0 < count <= len(_PLACEHOLDER_STRINGS)
+                else ", ".join(["?"] * count)
+            )
             return f"{quoted_column} IN ({placeholders_str})"
 
         raise ValueError(f"Unsupported operator for placeholder generation: {operator}")
@@ -259,60 +520,7 @@ class DynamoDBConditionParser(ConditionParser):
         """
         Converts a Python variable into a DynamoDB-formatted attribute value dictionary.
         """
-        if isinstance(value, str):
-            if value.lower() == "true":
-                return {"BOOL": True}
-            if value.lower() == "false":
-                return {"BOOL": False}
-            if value.lower() == "null":
-                return {"NULL": True}
-            try:
-                if value.isdigit() or (value.startswith("-") and value[1:].isdigit()):
-                    return {"N": str(int(value))}
-                return {"N": str(Decimal(value))}
-            except (ValueError, TypeError, json.JSONDecodeError, DecimalException):
-                return {"S": value}
-        elif isinstance(value, bool):
-            return {"BOOL": value}
-        elif isinstance(value, (int, float, Decimal)):
-            return {"N": str(value)}
-        elif value is None:
-            return {"NULL": True}
-        elif isinstance(value, bytes):
-            return {"B": base64.b64encode(value).decode("utf-8")}
-        elif isinstance(value, list):
-            # Each item will be AttributeValueTypeDef, so the list is List[AttributeValueTypeDef]
-            return {"L": [self.to_dynamodb_attribute_value(item) for item in value]}
-        elif isinstance(value, dict):
-            # Each value in the map will be AttributeValueTypeDef
-            return {
-                "M": {
-                    str(k): self.to_dynamodb_attribute_value(v)
-                    for k, v in value.items()
-                }
-            }
-        elif isinstance(value, set):
-            if not value:
-                raise ValueError(
-                    "Cannot determine DynamoDB Set type from an empty Python set."
-                )
-            if all(isinstance(item, str) for item in value):
-                return {"SS": sorted(list(value))}
-            elif all(isinstance(item, (int, float, Decimal)) for item in value):
-                return {"NS": sorted([str(item) for item in value])}
-            elif all(isinstance(item, bytes) for item in value):
-                return {
-                    "BS": sorted(
-                        [base64.b64encode(item).decode("utf-8") for item in value]
-                    )
-                }
-            raise ValueError(
-                "Set contains mixed types or unsupported types for DynamoDB Sets."
-            )
-        else:
-            raise TypeError(
-                f"Unsupported Python type for DynamoDB conversion: {type(value)}"
-            )
+        return _to_attribute_value(value)
 
     def _parse_condition_list(self, list_string: str) -> List[str]:
         """
@@ -326,28 +534,22 @@ class DynamoDBConditionParser(ConditionParser):
             if not list_string.strip():
                 return []
 
+        # tokenize in one C-level pass instead of accumulating character by character,
+        # which is quadratic in CPython for long lists
         items: List[str] = []
-        current_item: str = ""
-        in_quotes: bool = False
-        quote_char: str = ""
-        for char in list_string:
-            if char in ("'", '"'):
-                if in_quotes and char == quote_char:
-                    in_quotes = False
-                elif not in_quotes:
-                    in_quotes = True
-                    quote_char = char
-                else:
-                    current_item += char
-            elif char == "," and not in_quotes:
-                stripped_item = current_item.strip()
+        parts: List[str] = []
+        for token in _LIST_TOKEN_RE.findall(list_string):
+            if token == ",":
+                stripped_item = "".join(parts).strip()
                 if stripped_item:
                     items.append(stripped_item)
-                current_item = ""
+                parts = []
+            elif token[0] in "'\"":
+                parts.append(token[1:-1])
             else:
-                current_item += char
+                parts.append(token)
 
-        stripped_current_item = current_item.strip()
+        stripped_current_item = "".join(parts).strip()
         if stripped_current_item:
             items.append(stripped_current_item)
 
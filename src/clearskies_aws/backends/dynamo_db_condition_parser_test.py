@@ -63,6 +63,12 @@ class TestDynamoDBConditionParser(unittest.TestCase):
         )
         self.assertEqual(self.parser.to_dynamodb_attribute_value("text"), {"S": "text"})
 
+    def test_to_dynamodb_attribute_value_non_ascii_digits(self):
+        """Test that strings of non-ASCII digits stay strings, since DynamoDB rejects them in N values."""
+        self.assertEqual(
+            self.parser.to_dynamodb_attribute_value("١٢٣"), {"S": "١٢٣"}
+        )
+
     def test_to_dynamodb_attribute_value_list(self):
         """Test conversion of a list with mixed data types."""
         val = ["a", 1, True, None, Decimal("2.3")]
@@ -264,3 +270,37 @@ class TestDynamoDBConditionParser(unittest.TestCase):
         self.assertEqual(result["operator"], "IS NOT")
         self.assertEqual(result["values"], [{"S": "internal"}])
         self.assertEqual(result["parsed"], '"type" IS NOT ?')
+
+    def test_build_condition_simple_operator(self):
+        """Test building a simple comparison condition from structured inputs."""
+        result = self.parser.build_condition("age", ">", [30])
+        self.assertEqual(result["column"], "age")
+        self.assertEqual(result["operator"], ">")
+        self.assertEqual(result["values"], [{"N": "30"}])
+        self.assertEqual(result["parsed"], '"age" > ?')
+
+    def test_build_condition_in(self):
+        """Test building an IN condition with one placeholder per value."""
+        result = self.parser.build_condition("status", "in", ["active", "pending"])
+        self.assertEqual(result["operator"], "IN")
+        self.assertEqual(result["values"], [{"S": "active"}, {"S": "pending"}])
+        self.assertEqual(result["parsed"], '"status" IN (?, ?)')
+
+    def test_build_condition_like_remaps_to_contains(self):
+        """Test building a 'like' condition with surrounding wildcards."""
+        result = self.parser.build_condition("name", "like", ["%jane%"])
+        self.assertEqual(result["operator"], "CONTAINS")
+        self.assertEqual(result["values"], [{"S": "jane"}])
+        self.assertEqual(result["parsed"], 'contains("name", ?)')
+
+    def test_build_condition_is_null_remaps(self):
+        """Test building an 'is null' condition remaps to IS MISSING."""
+        result = self.parser.build_condition("name", "is null", [])
+        self.assertEqual(result["operator"], "IS MISSING")
+        self.assertEqual(result["values"], [])
+        self.assertEqual(result["parsed"], '"name" IS MISSING')
+
+    def test_build_condition_unsupported_operator(self):
+        """Test that building a condition with an unknown operator raises an error."""
+        with self.assertRaisesRegex(ValueError, "Unsupported operator"):
+            self.parser.build_condition("name", "almost_equals", ["jane"])
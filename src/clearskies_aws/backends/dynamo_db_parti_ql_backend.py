@@ -3,8 +3,11 @@ import binascii
 import json
 import logging
 import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal, InvalidOperation
-from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
 
 from boto3.session import Session as Boto3Session
 from botocore.exceptions import ClientError
@@ -20,11 +23,98 @@ from types_boto3_dynamodb.type_defs import (
     KeySchemaElementTypeDef,
 )
 
-from clearskies_aws.backends.dynamo_db_condition_parser import DynamoDBConditionParser
+from clearskies_aws.backends.dynamo_db_condition_parser import (
+    DynamoDBConditionParser,
+    _to_attribute_value_lenient,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _decode_n(value: str) -> Any:
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        logger.warning(f"Could not convert N value '{value}' to Decimal.")
+        return value
+
+
+def _decode_l(value: List[Any]) -> List[Any]:
+    return [_decode_attribute_value(item) for item in value]
+
+
+def _decode_m(value: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: _decode_attribute_value(val) for key, val in value.items()}
+
+
+def _decode_ns(value: List[str]) -> set:
+    try:
+        return set(Decimal(n_val) for n_val in value)
+    except InvalidOperation:
+        logger.warning(
+            f"Could not convert one or more NS values in '{value}' to Decimal."
+        )
+        return set(value)
+
+
+# Type-tag dispatch for unwrapping DynamoDB attribute values.  Each attribute value
+# dict carries exactly one type key, so a single dict lookup replaces the chain of
+# `"S" in attribute_value` membership checks the old decoder ran per attribute.
+# B/BS arrive as raw bytes: botocore handles the wire base64 in both directions,
+# so they pass through untouched (base64-decoding them again corrupts the data).
+_DECODERS: Dict[str, Callable[[Any], Any]] = {
+    "S": lambda value: value,
+    "N": _decode_n,
+    "BOOL": lambda value: value,
+    "NULL": lambda value: None,
+    "B": lambda value: value,
+    "L": _decode_l,
+    "M": _decode_m,
+    "SS": set,
+    "NS": _decode_ns,
+    "BS": set,
+}
+
+
+def _decode_attribute_value(attribute_value: Any) -> Any:
+    if not isinstance(attribute_value, dict):
+        return attribute_value
+    if attribute_value:
+        type_tag, value = next(iter(attribute_value.items()))
+        decoder = _DECODERS.get(type_tag)
+        if decoder is not None:
+            return decoder(value)
+    logger.warning(f"Unrecognized DynamoDB attribute type: {attribute_value}")
+    return attribute_value
+
+
+# operator tables for building native Query/Scan expressions: comparison operators map
+# to their DynamoDB spelling, function-style operators to (negation prefix, function
+# name), and the null checks to the attribute-existence functions
+_KEY_COMPARISON_OPERATORS = frozenset({"=", ">", "<", ">=", "<="})
+_FILTER_COMPARISON_OPERATORS = {
+    "=": "=",
+    "!=": "<>",
+    ">": ">",
+    "<": "<",
+    ">=": ">=",
+    "<=": "<=",
+}
+_FILTER_FUNCTION_OPERATORS = {
+    "contains": ("", "contains"),
+    "not contains": ("NOT ", "contains"),
+    "begins_with": ("", "begins_with"),
+    "not begins_with": ("NOT ", "begins_with"),
+}
+_FILTER_EXISTENCE_OPERATORS = {
+    "is null": "attribute_not_exists",
+    "is not null": "attribute_exists",
+}
+
+# DynamoDB accepts at most this many statements per BatchExecuteStatement call
+_BATCH_STATEMENT_LIMIT = 25
+
+
 class DynamoDBPartiQLCursor:
     """
     Cursor for executing PartiQL statements against DynamoDB.
@@ -132,6 +222,17 @@ class DynamoDBPartiQLBackend(CursorBackend):
         "joins",
     ]
     _required_configs: List[str] = ["table_name"]
+    # Number of parallel Scan segments used by count() when it falls back to a table
+    # Scan.  The default of 1 keeps the serial behavior; raising it splits the scan
+    # into that many segments that run concurrently, which scales near-linearly for
+    # large tables (each segment consumes its own read capacity).
+    count_scan_segments: int = 1
+    # as_sql output is cached per query shape; cap the cache so a stream of unique
+    # shapes can't grow it without bound
+    _sql_cache_max_size: int = 512
+    # attempts per BatchExecuteStatement chunk before giving up on statements that
+    # keep coming back with errors
+    _batch_retry_attempts: int = 3
 
     def __init__(self, dynamo_db_parti_ql_cursor: DynamoDBPartiQLCursor) -> None:
         """
@@ -140,6 +241,12 @@ class DynamoDBPartiQLBackend(CursorBackend):
         super().__init__(dynamo_db_parti_ql_cursor)
         self.condition_parser: DynamoDBConditionParser = DynamoDBConditionParser()
         self._table_descriptions_cache: Dict[str, Dict[str, Any]] = {}
+        self._key_schema_cache: Dict[str, Dict[str, Any]] = {}
+        self._sql_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+        # the escape characters are fixed per backend, so resolve them once instead of
+        # paying a method call in every statement-building loop
+        self._table_escape: str = self._table_escape_character()
+        self._column_escape: str = self._column_escape_character()
 
     def _get_table_description(self, table_name: str) -> Dict[str, Any]:
         """
@@ -153,6 +260,38 @@ class DynamoDBPartiQLBackend(CursorBackend):
                 raise
         return self._table_descriptions_cache[table_name].get("Table", {})
 
+    def _get_key_schema(self, table_name: str) -> Dict[str, Any]:
+        """
+        Returns the flattened key schema for a table: its partition ('pk') and sort
+        ('sk') key names plus those of each GSI, keyed by index name under 'gsi'.
+
+        The describe_table response is walked once per table and the result cached,
+        so hot paths do a single dict lookup instead of re-scanning the KeySchema and
+        GlobalSecondaryIndexes lists on every call.
+        """
+        cached = self._key_schema_cache.get(table_name)
+        if cached is not None:
+            return cached
+
+        table_description = self._get_table_description(table_name)
+        flattened: Dict[str, Any] = {"pk": None, "sk": None, "gsi": {}}
+        for key_element in table_description.get("KeySchema", []):
+            if key_element["KeyType"] == "HASH":
+                flattened["pk"] = key_element["AttributeName"]
+            elif key_element["KeyType"] == "RANGE":
+                flattened["sk"] = key_element["AttributeName"]
+        for gsi in table_description.get("GlobalSecondaryIndexes", []):
+            gsi_keys: Dict[str, Optional[str]] = {"pk": None, "sk": None}
+            for key_element in gsi.get("KeySchema", []):
+                if key_element["KeyType"] == "HASH":
+                    gsi_keys["pk"] = key_element["AttributeName"]
+                elif key_element["KeyType"] == "RANGE":
+                    gsi_keys["sk"] = key_element["AttributeName"]
+            flattened["gsi"][gsi.get("IndexName", "")] = gsi_keys
+
+        self._key_schema_cache[table_name] = flattened
+        return flattened
+
     def _table_escape_character(self) -> str:
         """Returns the character used to escape table/index names."""
         return '"'
@@ -169,7 +308,7 @@ class DynamoDBPartiQLBackend(CursorBackend):
         """
         if not table_name:
             return ""
-        esc: str = self._table_escape_character()
+        esc: str = self._table_escape
         final_name = f"{esc}{str(table_name).strip(esc)}{esc}"
         if index_name:
             final_name += f".{esc}{index_name.strip(esc)}{esc}"
@@ -202,36 +341,16 @@ class DynamoDBPartiQLBackend(CursorBackend):
                 )
                 continue
 
-            value_parts: List[str] = []
-            for v in values:
-                if isinstance(v, str):
-                    value_parts.append(f"'{v}'")
-                elif isinstance(v, bool):
-                    value_parts.append(str(v).lower())
-                elif isinstance(v, (int, float, Decimal, type(None))):
-                    value_parts.append(str(v))
-                else:
-                    value_parts.append(f"'{str(v)}'")
-
-            condition_string: str = ""
-            op_lower: str = operator.lower()
-            if op_lower == "in":
-                condition_string = f"{column} {operator} ({', '.join(value_parts)})"
-            elif op_lower in self.condition_parser.operators_without_placeholders:
-                condition_string = f"{column} {operator}"
-            else:
-                condition_string = (
-                    f"{column} {operator} {value_parts[0] if value_parts else ''}"
-                )
-
+            # build the fragment and parameters straight from the structured pieces
+            # instead of formatting them into a condition string just to re-parse it
             try:
-                parsed: Dict[str, Any] = self.condition_parser.parse_condition(
-                    condition_string
+                parsed: Dict[str, Any] = self.condition_parser.build_condition(
+                    column, operator, values
                 )
                 where_parts.append(parsed["parsed"])
                 parameters.extend(parsed["values"])
             except ValueError as e:
-                logger.error(f"Error parsing condition '{condition_string}': {e}")
+                logger.error(f"Error building condition for '{where}': {e}")
                 continue
 
         if not where_parts:
@@ -243,8 +362,128 @@ class DynamoDBPartiQLBackend(CursorBackend):
     ) -> Tuple[str, List[AttributeValueTypeDef], Optional[int], Optional[str]]:
         """
         Constructs a PartiQL statement and parameters from a query configuration.
+
+        The statement string is a pure function of the query's shape (table, index,
+        selects, sorts, and the column/operator of each condition), so it is cached
+        per shape: repeat queries that only differ in their bound values skip all
+        string building and just re-convert the values.
         """
-        escape: str = self._column_escape_character()
+        limit: Optional[int] = configuration.get("limit")
+        if limit is not None:
+            limit = int(limit)
+
+        next_token: Optional[str] = configuration.get("pagination", {}).get(
+            "next_token"
+        )
+        if next_token is not None:
+            next_token = str(next_token)
+
+        cache_key = self._as_sql_cache_key(configuration)
+        if cache_key is not None:
+            statement = self._sql_cache.get(cache_key)
+            if statement is not None:
+                self._sql_cache.move_to_end(cache_key)
+                parameters = self._parameters_for_cached_wheres(
+                    configuration.get("wheres", [])
+                )
+                return statement, parameters, limit, next_token
+
+        statement, parameters = self._build_sql(configuration)
+        if cache_key is not None:
+            self._sql_cache[cache_key] = statement
+            if len(self._sql_cache) > self._sql_cache_max_size:
+                self._sql_cache.popitem(last=False)
+        return statement, parameters, limit, next_token
+
+    def _as_sql_cache_key(self, configuration: Dict[str, Any]) -> Optional[Tuple]:
+        """
+        Builds a hashable shape key for the as_sql cache, or returns None when the
+        configuration is not safely cacheable.
+
+        The key deliberately excludes the condition values themselves.  Configurations
+        that produce per-call warnings (group_by/joins, select_all combined with
+        selects, malformed wheres) stay uncached so the warnings keep firing.  'like'
+        conditions are excluded because their parsed form depends on the wildcard
+        placement inside the value, and so is any operator the build path would skip
+        with an error — otherwise a hit would bind parameters for a condition the
+        cached statement doesn't contain.
+        """
+        if configuration.get("group_by_column") or configuration.get("joins"):
+            return None
+        selects = configuration.get("selects") or []
+        if configuration.get("select_all") and selects:
+            return None
+
+        parser = self.condition_parser
+        simple_placeholders = parser.operators_with_simple_placeholders
+        special_placeholders = parser.operators_with_special_placeholders
+        without_placeholders = parser.operators_without_placeholders
+        needs_remap = parser.operator_needs_remap
+        where_shapes: List[Tuple[str, str, int]] = []
+        for where in configuration.get("wheres", []):
+            if not isinstance(where, dict):
+                return None
+            column = where.get("column")
+            operator = where.get("operator")
+            values = where.get("values")
+            if not column or not operator or values is None:
+                return None
+            op_lower = operator.lower()
+            if op_lower in without_placeholders or op_lower in needs_remap:
+                pass
+            elif op_lower == "in":
+                pass
+            elif op_lower in simple_placeholders or op_lower in special_placeholders:
+                if not values:
+                    return None
+            else:
+                return None
+            where_shapes.append((column, op_lower, len(values)))
+
+        sort_shapes: List[Tuple[str, str]] = []
+        for sort in configuration.get("sorts") or []:
+            sort_shapes.append((sort["column"], sort.get("direction", "ASC").upper()))
+
+        return (
+            configuration.get("table_name", ""),
+            configuration.get("_chosen_index_name"),
+            tuple(selects),
+            tuple(sort_shapes),
+            tuple(where_shapes),
+        )
+
+    def _parameters_for_cached_wheres(
+        self, wheres: List[Dict[str, Any]]
+    ) -> List[AttributeValueTypeDef]:
+        """
+        Converts the condition values for a cached statement, mirroring the number of
+        placeholders each operator emits: none for the missing/null checks, one per
+        IN-list item, and one (the first value) for everything else.  Values convert
+        through the same lenient path build_condition uses, so cache hits and misses
+        bind identical parameters.
+        """
+        to_attribute_value = _to_attribute_value_lenient
+        without_placeholders = self.condition_parser.operators_without_placeholders
+        needs_remap = self.condition_parser.operator_needs_remap
+        parameters: List[AttributeValueTypeDef] = []
+        for where in wheres:
+            op_lower = where["operator"].lower()
+            if op_lower in without_placeholders or op_lower in needs_remap:
+                continue
+            values = where["values"]
+            if op_lower == "in":
+                parameters.extend(to_attribute_value(value) for value in values)
+            else:
+                parameters.append(to_attribute_value(values[0]))
+        return parameters
+
+    def _build_sql(
+        self, configuration: Dict[str, Any]
+    ) -> Tuple[str, List[AttributeValueTypeDef]]:
+        """
+        Builds the PartiQL statement and parameters for a query configuration.
+        """
+        escape: str = self._column_escape
         table_name: str = configuration.get("table_name", "")
         chosen_index_name: Optional[str] = configuration.get("_chosen_index_name")
 
@@ -294,15 +533,6 @@ class DynamoDBPartiQLBackend(CursorBackend):
                 "but JOINs are not supported by this DynamoDB PartiQL backend and will be ignored for SQL generation."
             )
 
-        limit: Optional[int] = configuration.get("limit")
-        if limit is not None:
-            limit = int(limit)
-
-        pagination: Dict[str, Any] = configuration.get("pagination", {})
-        next_token: Optional[str] = pagination.get("next_token")
-        if next_token is not None:
-            next_token = str(next_token)
-
         if not from_clause_target:
             raise ValueError("Table name is required for constructing SQL query.")
 
@@ -310,7 +540,7 @@ class DynamoDBPartiQLBackend(CursorBackend):
             f"SELECT {select_clause} FROM {from_clause_target}{wheres}{order_by}".strip()
         )
 
-        return statement, parameters, limit, next_token
+        return statement, parameters
 
     def records(
         self,
@@ -360,6 +590,70 @@ class DynamoDBPartiQLBackend(CursorBackend):
                 next_token_from_ddb
             )
 
+    def records_paginated(
+        self,
+        configuration: Dict[str, Any],
+        model: ClearSkiesModel,
+        page_size: Optional[int] = None,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Fetches records across all DynamoDB result pages, prefetching the next page
+        while the current one is being consumed.
+
+        The page fetches are latency-bound HTTP round-trips, so as soon as a response
+        arrives its NextToken is used to request the following page from a background
+        thread while the caller iterates the current items.  Because each NextToken is
+        only known from the previous response, at most one page can be in flight ahead
+        of the consumer.
+
+        `page_size` sets the per-request Limit sent to DynamoDB and defaults to the
+        configuration's limit; the configuration's limit always caps the total number
+        of records yielded across all pages.
+        """
+        configuration = self._check_query_configuration(configuration, model)
+        statement, params, limit, client_next_token = self.as_sql(configuration)
+        next_token: Optional[str] = self.restore_next_token_from_config(
+            client_next_token
+        )
+
+        cursor_limit: Optional[int] = None
+        if page_size is not None and page_size > 0:
+            cursor_limit = page_size
+        elif limit is not None and limit > 0:
+            cursor_limit = limit
+
+        remaining: Optional[int] = limit if limit is not None and limit > 0 else None
+
+        def fetch_page(token: Optional[str]) -> ExecuteStatementOutputTypeDef:
+            return self._cursor.execute(
+                statement=statement,
+                parameters=params,
+                Limit=cursor_limit,
+                NextToken=token,
+            )
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            response = fetch_page(next_token)
+            while True:
+                items: List[Dict[str, Any]] = response.get("Items", [])
+                next_token = response.get("NextToken")
+                future = None
+                if next_token and (remaining is None or remaining > len(items)):
+                    future = executor.submit(fetch_page, next_token)
+
+                for item_raw in items:
+                    yield self._map_from_boto3(item_raw)
+                    if remaining is not None:
+                        remaining -= 1
+                        if remaining <= 0:
+                            if future is not None:
+                                future.cancel()
+                            return
+
+                if future is None:
+                    return
+                response = future.result()
+
     def _wheres_to_native_dynamo_expressions(
         self,
         conditions: List[Dict[str, Any]],
@@ -399,78 +693,68 @@ class DynamoDBPartiQLBackend(CursorBackend):
             value_counter += 1
             return placeholder
 
-        processed_condition_indices = set()
-
-        # First, try to build KeyConditionExpression for Partition Key and Sort Key
-        # Find partition key equality condition
-        pk_condition_index = -1
-        if partition_key_name:
-            for i, cond in enumerate(conditions):
-                if (
-                    cond.get("column") == partition_key_name
-                    and cond.get("operator") == "="
-                    and cond.get("values")
-                ):
-                    pk_condition_index = i
-                    break
-
-        if pk_condition_index != -1:
-            pk_cond = conditions[pk_condition_index]
-            pk_name_ph = get_name_placeholder(pk_cond["column"])
-            pk_value_ph = get_value_placeholder(pk_cond["values"][0])
+        # Single classification pass: claim the first partition-key equality and the
+        # first sort-key condition with a key-eligible operator; everything else is a
+        # filter.  No index bookkeeping — the chosen conditions are skipped by
+        # identity below.
+        pk_condition: Optional[Dict[str, Any]] = None
+        sk_condition: Optional[Dict[str, Any]] = None
+        for cond in conditions:
+            if (
+                pk_condition is None
+                and partition_key_name
+                and cond.get("column") == partition_key_name
+                and cond.get("operator") == "="
+                and cond.get("values")
+            ):
+                pk_condition = cond
+                continue
+            if (
+                sk_condition is None
+                and sort_key_name
+                and cond.get("column") == sort_key_name
+                and cond.get("values")
+                and (
+                    cond.get("operator", "").lower() in _KEY_COMPARISON_OPERATORS
+                    or cond.get("operator", "").lower() in ("between", "begins_with")
+                )
+            ):
+                sk_condition = cond
+
+        # A sort-key condition is only usable in KeyConditionExpression alongside a
+        # partition-key equality; without one it stays a filter.
+        if pk_condition is None:
+            sk_condition = None
+        else:
+            pk_name_ph = get_name_placeholder(pk_condition["column"])
+            pk_value_ph = get_value_placeholder(pk_condition["values"][0])
             key_condition_parts.append(f"{pk_name_ph} = {pk_value_ph}")
-            processed_condition_indices.add(pk_condition_index)
-
-            # If partition key found, check for sort key condition
-            if sort_key_name:
-                for i, cond in enumerate(conditions):
-                    if i in processed_condition_indices:
-                        continue
-                    if cond.get("column") == sort_key_name and cond.get("values"):
-                        op_lower = cond["operator"].lower()
-                        sk_name_ph = get_name_placeholder(cond["column"])
-
-                        if op_lower == "=":
-                            sk_value_ph = get_value_placeholder(cond["values"][0])
-                            key_condition_parts.append(f"{sk_name_ph} = {sk_value_ph}")
-                        elif op_lower == ">":
-                            sk_value_ph = get_value_placeholder(cond["values"][0])
-                            key_condition_parts.append(f"{sk_name_ph} > {sk_value_ph}")
-                        elif op_lower == "<":
-                            sk_value_ph = get_value_placeholder(cond["values"][0])
-                            key_condition_parts.append(f"{sk_name_ph} < {sk_value_ph}")
-                        elif op_lower == ">=":
-                            sk_value_ph = get_value_placeholder(cond["values"][0])
-                            key_condition_parts.append(f"{sk_name_ph} >= {sk_value_ph}")
-                        elif op_lower == "<=":
-                            sk_value_ph = get_value_placeholder(cond["values"][0])
-                            key_condition_parts.append(f"{sk_name_ph} <= {sk_value_ph}")
-                        elif op_lower == "between":
-                            if len(cond["values"]) == 2:
-                                sk_value1_ph = get_value_placeholder(cond["values"][0])
-                                sk_value2_ph = get_value_placeholder(cond["values"][1])
-                                key_condition_parts.append(
-                                    f"{sk_name_ph} BETWEEN {sk_value1_ph} AND {sk_value2_ph}"
-                                )
-                            else:
-                                logger.warning(
-                                    f"Skipping malformed BETWEEN condition for sort key: {cond}"
-                                )
-                        elif op_lower == "begins_with":
-                            sk_value_ph = get_value_placeholder(cond["values"][0])
-                            key_condition_parts.append(
-                                f"begins_with({sk_name_ph}, {sk_value_ph})"
-                            )
-                        else:
-                            # Other operators for sort key are not part of KeyConditionExpression
-                            # They will be handled in FilterExpression below
-                            continue
-                        processed_condition_indices.add(i)
-                        break  # Assume only one sort key condition for KeyConditionExpression
-
-        # Process all remaining conditions for FilterExpression
-        for i, cond in enumerate(conditions):
-            if i in processed_condition_indices:
+
+            if sk_condition is not None:
+                op_lower = sk_condition["operator"].lower()
+                values = sk_condition["values"]
+                sk_name_ph = get_name_placeholder(sk_condition["column"])
+                if op_lower in _KEY_COMPARISON_OPERATORS:
+                    key_condition_parts.append(
+                        f"{sk_name_ph} {op_lower} {get_value_placeholder(values[0])}"
+                    )
+                elif op_lower == "begins_with":
+                    key_condition_parts.append(
+                        f"begins_with({sk_name_ph}, {get_value_placeholder(values[0])})"
+                    )
+                elif op_lower == "between" and len(values) == 2:
+                    key_condition_parts.append(
+                        f"{sk_name_ph} BETWEEN {get_value_placeholder(values[0])}"
+                        f" AND {get_value_placeholder(values[1])}"
+                    )
+                else:
+                    logger.warning(
+                        f"Skipping malformed BETWEEN condition for sort key: {sk_condition}"
+                    )
+
+        # Everything not claimed for the KeyConditionExpression becomes a filter
+        for cond in conditions:
+            if cond is pk_condition or cond is sk_condition:
                 continue
 
             col_name = cond.get("column")
@@ -483,24 +767,24 @@ class DynamoDBPartiQLBackend(CursorBackend):
             name_ph = get_name_placeholder(col_name)
             op_lower = op.lower()
 
-            if op_lower == "=":
-                value_ph = get_value_placeholder(vals[0])
-                filter_expression_parts.append(f"{name_ph} = {value_ph}")
-            elif op_lower == "!=":
-                value_ph = get_value_placeholder(vals[0])
-                filter_expression_parts.append(f"{name_ph} <> {value_ph}")
-            elif op_lower == ">":
+            comparison = _FILTER_COMPARISON_OPERATORS.get(op_lower)
+            if comparison is not None:
                 value_ph = get_value_placeholder(vals[0])
-                filter_expression_parts.append(f"{name_ph} > {value_ph}")
-            elif op_lower == "<":
-                value_ph = get_value_placeholder(vals[0])
-                filter_expression_parts.append(f"{name_ph} < {value_ph}")
-            elif op_lower == ">=":
-                value_ph = get_value_placeholder(vals[0])
-                filter_expression_parts.append(f"{name_ph} >= {value_ph}")
-            elif op_lower == "<=":
+                filter_expression_parts.append(f"{name_ph} {comparison} {value_ph}")
+                continue
+
+            function_operator = _FILTER_FUNCTION_OPERATORS.get(op_lower)
+            if function_operator is not None:
+                prefix, function_name = function_operator
                 value_ph = get_value_placeholder(vals[0])
-                filter_expression_parts.append(f"{name_ph} <= {value_ph}")
+                filter_expression_parts.append(
+                    f"{prefix}{function_name}({name_ph}, {value_ph})"
+                )
+                continue
+
+            existence_function = _FILTER_EXISTENCE_OPERATORS.get(op_lower)
+            if existence_function is not None:
+                filter_expression_parts.append(f"{existence_function}({name_ph})")
             elif op_lower == "between":
                 if len(vals) == 2:
                     value1_ph = get_value_placeholder(vals[0])
@@ -513,24 +797,6 @@ class DynamoDBPartiQLBackend(CursorBackend):
             elif op_lower == "in":
                 value_placeholders = ", ".join([get_value_placeholder(v) for v in vals])
                 filter_expression_parts.append(f"{name_ph} IN ({value_placeholders})")
-            elif op_lower == "contains":
-                value_ph = get_value_placeholder(vals[0])
-                filter_expression_parts.append(f"contains({name_ph}, {value_ph})")
-            elif op_lower == "not contains":
-                value_ph = get_value_placeholder(vals[0])
-                filter_expression_parts.append(f"NOT contains({name_ph}, {value_ph})")
-            elif op_lower == "begins_with":
-                value_ph = get_value_placeholder(vals[0])
-                filter_expression_parts.append(f"begins_with({name_ph}, {value_ph})")
-            elif op_lower == "not begins_with":
-                value_ph = get_value_placeholder(vals[0])
-                filter_expression_parts.append(
-                    f"NOT begins_with({name_ph}, {value_ph})"
-                )
-            elif op_lower == "is null":
-                filter_expression_parts.append(f"attribute_not_exists({name_ph})")
-            elif op_lower == "is not null":
-                filter_expression_parts.append(f"attribute_exists({name_ph})")
             elif (
                 op_lower == "like"
             ):  # Clearskies 'like' usually translates to begins_with or contains
@@ -583,27 +849,12 @@ class DynamoDBPartiQLBackend(CursorBackend):
             "_partition_key_for_target"
         )
         # Get sort key for the chosen target (base table or GSI)
-        sort_key_for_target: Optional[str] = None
-        table_description = self._get_table_description(table_name)
+        key_schema = self._get_key_schema(table_name)
+        sort_key_for_target: Optional[str]
         if chosen_index_name:
-            gsi_definitions: List[GlobalSecondaryIndexDescriptionTypeDef] = (
-                table_description.get("GlobalSecondaryIndexes", [])
-            )
-            for gsi in gsi_definitions:
-                if gsi.get("IndexName", "") == chosen_index_name:
-                    for key_element in gsi.get("KeySchema", []):
-                        if key_element["KeyType"] == "RANGE":
-                            sort_key_for_target = key_element["AttributeName"]
-                            break
-                    break
+            sort_key_for_target = key_schema["gsi"].get(chosen_index_name, {}).get("sk")
         else:
-            base_table_key_schema: List[KeySchemaElementTypeDef] = (
-                table_description.get("KeySchema", [])
-            )
-            for key_element in base_table_key_schema:
-                if key_element["KeyType"] == "RANGE":
-                    sort_key_for_target = key_element["AttributeName"]
-                    break
+            sort_key_for_target = key_schema["sk"]
 
         wheres_config = configuration.get("wheres", [])
 
@@ -660,6 +911,16 @@ class DynamoDBPartiQLBackend(CursorBackend):
                 "ExpressionAttributeValues"
             ]
 
+        if not can_use_query_for_count and self.count_scan_segments > 1:
+            return self._parallel_scan_count(params_for_native_call)
+        return self._serial_count(params_for_native_call, can_use_query_for_count)
+
+    def _serial_count(
+        self, params_for_native_call: Dict[str, Any], can_use_query_for_count: bool
+    ) -> int:
+        """
+        Pages through a native Query/Scan count serially, following LastEvaluatedKey.
+        """
         total_count = 0
         exclusive_start_key: Optional[Dict[str, AttributeValueTypeDef]] = None
 
@@ -691,6 +952,44 @@ class DynamoDBPartiQLBackend(CursorBackend):
 
         return total_count
 
+    def _parallel_scan_count(self, params_for_native_call: Dict[str, Any]) -> int:
+        """
+        Counts via a DynamoDB Parallel Scan: the table is split into
+        count_scan_segments segments that are scanned concurrently, and each worker
+        pages through its own segment before the per-segment counts are summed.
+        The count calls are latency-bound HTTP round-trips, so the wall-clock time
+        scales down near-linearly with the number of segments.
+        """
+        total_segments = self.count_scan_segments
+
+        def count_segment(segment: int) -> int:
+            segment_params: Dict[str, Any] = {
+                **params_for_native_call,
+                "TotalSegments": total_segments,
+                "Segment": segment,
+            }
+            segment_count = 0
+            while True:
+                try:
+                    logger.debug(
+                        f"Executing native DynamoDB Scan (for count) with params: {segment_params}"
+                    )
+                    response = self._cursor._client.scan(**segment_params)  # type: ignore
+                except ClientError as e:
+                    logger.error(
+                        f"Error executing native DynamoDB operation for count: {e}. Params: {segment_params}"
+                    )
+                    raise
+
+                segment_count += response.get("Count", 0)
+                exclusive_start_key = response.get("LastEvaluatedKey")
+                if not exclusive_start_key:
+                    return segment_count
+                segment_params["ExclusiveStartKey"] = exclusive_start_key
+
+        with ThreadPoolExecutor(max_workers=total_segments) as executor:
+            return sum(executor.map(count_segment, range(total_segments)))
+
     def create(self, data: Dict[str, Any], model: ClearSkiesModel) -> Dict[str, Any]:
         """
         Creates a new record in DynamoDB using PartiQL INSERT.
@@ -701,7 +1000,26 @@ class DynamoDBPartiQLBackend(CursorBackend):
             logger.warning("Create called with empty data. Nothing to insert.")
             return {}
 
-        # Prepare parameters
+        statement, parameters = self._insert_statement_and_parameters(table_name, data)
+
+        try:
+            self._cursor.execute(
+                statement=statement,
+                parameters=parameters,
+            )
+            return data
+        except Exception as e:
+            logger.error(
+                f"Error executing INSERT PartiQL statement: {statement}, data: {data}, error: {e}"
+            )
+            raise
+
+    def _insert_statement_and_parameters(
+        self, table_name: str, data: Dict[str, Any]
+    ) -> Tuple[str, List[AttributeValueTypeDef]]:
+        """
+        Builds the PartiQL INSERT statement and parameters for a single record.
+        """
         parameters: List[AttributeValueTypeDef] = []
 
         # Build the 'VALUE {key: ?, key: ?}' part and collect parameters
@@ -713,19 +1031,82 @@ class DynamoDBPartiQLBackend(CursorBackend):
         value_struct_clause = ", ".join(value_struct_parts)
 
         # Construct the INSERT statement with explicit struct format
-        statement = f"INSERT INTO {table_name} VALUE {{{value_struct_clause}}}"
+        return f"INSERT INTO {table_name} VALUE {{{value_struct_clause}}}", parameters
 
-        try:
-            self._cursor.execute(
-                statement=statement,
-                parameters=parameters,
+    def create_many(
+        self, data_list: List[Dict[str, Any]], model: ClearSkiesModel
+    ) -> List[Dict[str, Any]]:
+        """
+        Creates multiple records in DynamoDB using PartiQL BatchExecuteStatement.
+
+        Inserts are grouped into batches of up to 25 statements (the DynamoDB batch
+        limit), so a bulk ingest of N records costs ceil(N / 25) round-trips instead
+        of N.  Statements that come back from a batch with an error are retried with
+        exponential backoff before giving up.
+        """
+        if not data_list:
+            return []
+
+        table_name: str = self._finalize_table_name(model.get_table_name())
+
+        statements: List[Dict[str, Any]] = []
+        for data in data_list:
+            if not data:
+                logger.warning("create_many received an empty record. Skipping it.")
+                continue
+            statement, parameters = self._insert_statement_and_parameters(
+                table_name, data
             )
-            return data
-        except Exception as e:
-            logger.error(
-                f"Error executing INSERT PartiQL statement: {statement}, data: {data}, error: {e}"
+            entry: Dict[str, Any] = {"Statement": statement}
+            if parameters:
+                entry["Parameters"] = parameters
+            statements.append(entry)
+
+        for start in range(0, len(statements), _BATCH_STATEMENT_LIMIT):
+            self._execute_statement_batch(
+                statements[start : start + _BATCH_STATEMENT_LIMIT]
             )
-            raise
+        return data_list
+
+    def _execute_statement_batch(self, statements: List[Dict[str, Any]]) -> None:
+        """
+        Executes one BatchExecuteStatement call, retrying any statements that come
+        back with a per-statement error using exponential backoff.
+        """
+        pending = statements
+        delay = 0.05
+        for attempt in range(self._batch_retry_attempts):
+            try:
+                response = self._cursor._client.batch_execute_statement(  # type: ignore
+                    Statements=pending
+                )
+            except ClientError as e:
+                logger.error(f"Error executing BatchExecuteStatement: {e}")
+                raise
+
+            failed: List[Dict[str, Any]] = []
+            errors: List[Dict[str, Any]] = []
+            for entry, entry_response in zip(pending, response.get("Responses", [])):
+                error = entry_response.get("Error")
+                if error:
+                    failed.append(entry)
+                    errors.append(error)
+            if not failed:
+                return
+
+            if attempt == self._batch_retry_attempts - 1:
+                logger.error(
+                    f"BatchExecuteStatement left {len(failed)} statement(s) unprocessed after {self._batch_retry_attempts} attempts: {errors}"
+                )
+                raise ValueError(
+                    f"Failed to execute {len(failed)} batched PartiQL statement(s): {errors}"
+                )
+            logger.warning(
+                f"Retrying {len(failed)} unprocessed statement(s) from BatchExecuteStatement (attempt {attempt + 1})."
+            )
+            time.sleep(delay)
+            delay *= 2
+            pending = failed
 
     def update(
         self, id_value: Any, data: Dict[str, Any], model: ClearSkiesModel
@@ -820,9 +1201,9 @@ class DynamoDBPartiQLBackend(CursorBackend):
         Returns:
             A dictionary with values unwrapped to Python native types.
         """
-        return {
-            key: self._map_from_boto3_value(value) for (key, value) in record.items()
-        }
+        # local-bound decoder so the per-attribute call skips the attribute lookup
+        decode = _decode_attribute_value
+        return {key: decode(value) for (key, value) in record.items()}
 
     def _map_from_boto3_value(self, attribute_value: AttributeValueTypeDef) -> Any:
         """
@@ -834,59 +1215,7 @@ class DynamoDBPartiQLBackend(CursorBackend):
         Returns:
             The unwrapped Python native value.
         """
-        if not isinstance(attribute_value, dict):
-            return attribute_value
-
-        if "S" in attribute_value:
-            return attribute_value["S"]
-        if "N" in attribute_value:
-            try:
-                return Decimal(attribute_value["N"])
-            except InvalidOperation:  # Changed from DecimalException
-                logger.warning(
-                    f"Could not convert N value '{attribute_value['N']}' to Decimal."
-                )
-                return attribute_value["N"]
-        if "BOOL" in attribute_value:
-            return attribute_value["BOOL"]
-        if "NULL" in attribute_value:
-            return None
-        if "B" in attribute_value:
-            try:
-                return base64.b64decode(attribute_value["B"])
-            except (binascii.Error, TypeError) as e:
-                logger.warning(
-                    f"Failed to decode base64 binary value: {attribute_value['B']}, error: {e}"
-                )
-                return attribute_value["B"]  # Return raw if decoding fails
-        if "L" in attribute_value:
-            return [self._map_from_boto3_value(item) for item in attribute_value["L"]]
-        if "M" in attribute_value:
-            return {
-                key: self._map_from_boto3_value(val)
-                for key, val in attribute_value["M"].items()
-            }
-        if "SS" in attribute_value:
-            return set(attribute_value["SS"])
-        if "NS" in attribute_value:
-            try:
-                return set(Decimal(n_val) for n_val in attribute_value["NS"])
-            except InvalidOperation:  # Changed from DecimalException
-                logger.warning(
-                    f"Could not convert one or more NS values in '{attribute_value['NS']}' to Decimal."
-                )
-                return set(attribute_value["NS"])
-        if "BS" in attribute_value:
-            try:
-                return set(base64.b64decode(b_val) for b_val in attribute_value["BS"])
-            except (binascii.Error, TypeError) as e:
-                logger.warning(
-                    f"Failed to decode one or more base64 binary values in '{attribute_value['BS']}', error: {e}"
-                )
-                return set(attribute_value["BS"])  # Return raw if decoding fails
-
-        logger.warning(f"Unrecognized DynamoDB attribute type: {attribute_value}")
-        return attribute_value
+        return _decode_attribute_value(attribute_value)
 
     def _check_query_configuration(
         self, configuration: Dict[str, Any], model: ClearSkiesModel
@@ -160,6 +160,56 @@ class TestDynamoDBPartiQLBackend(unittest.TestCase):
             "but JOINs are not supported by this DynamoDB PartiQL backend and will be ignored for SQL generation."
         )
 
+    def test_as_sql_caches_statement_per_query_shape(self, mock_logger_arg):
+        """Test as_sql reuses the cached statement when only condition values change."""
+        config1 = self._get_base_config(
+            table_name="customers",
+            select_all=True,
+            wheres=[{"column": "city", "operator": "=", "values": ["New York"]}],
+        )
+        config1["_chosen_index_name"] = None
+        statement1, params1, _, _ = self.backend.as_sql(config1)
+
+        config2 = self._get_base_config(
+            table_name="customers",
+            select_all=True,
+            wheres=[{"column": "city", "operator": "=", "values": ["Boston"]}],
+        )
+        config2["_chosen_index_name"] = None
+        statement2, params2, _, _ = self.backend.as_sql(config2)
+
+        self.assertEqual('SELECT * FROM "customers" WHERE "city" = ?', statement1)
+        self.assertEqual(statement1, statement2)
+        self.assertEqual([{"S": "New York"}], params1)
+        self.assertEqual([{"S": "Boston"}], params2)
+        self.assertEqual(1, len(self.backend._sql_cache))
+
+    def test_as_sql_binds_all_value_types_as_parameters(self, mock_logger_arg):
+        """Test as_sql binds values like None as typed parameters, cached or not."""
+        config1 = self._get_base_config(
+            table_name="users",
+            select_all=True,
+            wheres=[{"column": "deleted_at", "operator": "=", "values": [None]}],
+        )
+        config1["_chosen_index_name"] = None
+        statement1, params1, _, _ = self.backend.as_sql(config1)
+
+        config2 = self._get_base_config(
+            table_name="users",
+            select_all=True,
+            wheres=[
+                {"column": "deleted_at", "operator": "=", "values": ["2024-01-01"]}
+            ],
+        )
+        config2["_chosen_index_name"] = None
+        statement2, params2, _, _ = self.backend.as_sql(config2)
+
+        self.assertEqual('SELECT * FROM "users" WHERE "deleted_at" = ?', statement1)
+        self.assertEqual(statement1, statement2)
+        self.assertEqual([{"NULL": True}], params1)
+        self.assertEqual([{"S": "2024-01-01"}], params2)
+        self.assertEqual(1, len(self.backend._sql_cache))
+
     def test_check_query_configuration_sort_with_base_table_hash_key_equality(
         self, mock_logger_arg
     ):
@@ -282,6 +332,24 @@ class TestDynamoDBPartiQLBackend(unittest.TestCase):
         self.assertEqual(count, 175)
         self.assertEqual(self.mock_dynamodb_client.scan.call_count, 3)
 
+    def test_count_parallel_scan_segments(self, mock_logger_arg):
+        """Test count() fans a Scan out over parallel segments when configured to."""
+        self.backend._get_table_description.return_value = {
+            "KeySchema": [{"AttributeName": "id", "KeyType": "HASH"}]
+        }
+        self.backend.count_scan_segments = 4
+        config = self._get_base_config(table_name="large_table")
+        self.mock_dynamodb_client.scan.side_effect = lambda **kwargs: {"Count": 10}
+
+        count = self.backend.count(config, self.mock_model)
+        self.assertEqual(count, 40)
+        self.assertEqual(self.mock_dynamodb_client.scan.call_count, 4)
+        scan_calls = self.mock_dynamodb_client.scan.call_args_list
+        self.assertEqual(sorted(c.kwargs["Segment"] for c in scan_calls), [0, 1, 2, 3])
+        for scan_call in scan_calls:
+            self.assertEqual(scan_call.kwargs["TotalSegments"], 4)
+            self.assertEqual(scan_call.kwargs["Select"], "COUNT")
+
     def test_records_simple_fetch(self, mock_logger_arg):
         """Test records() fetching a single page of results without limit or pagination."""
         config = self._get_base_config(table_name="users", select_all=True)
@@ -465,6 +533,52 @@ class TestDynamoDBPartiQLBackend(unittest.TestCase):
             expected_client_token,
         )
 
+    def test_records_paginated_walks_all_pages(self, mock_logger_arg):
+        """Test records_paginated() follows NextToken chains across pages."""
+        config = self._get_base_config(table_name="users", select_all=True)
+        self.mock_dynamodb_client.execute_statement.side_effect = [
+            {"Items": [{"id": {"S": "user1"}}], "NextToken": "page2"},
+            {"Items": [{"id": {"S": "user2"}}, {"id": {"S": "user3"}}]},
+        ]
+
+        results = list(self.backend.records_paginated(config, self.mock_model))
+
+        self.assertEqual(
+            results, [{"id": "user1"}, {"id": "user2"}, {"id": "user3"}]
+        )
+        self.assertEqual(2, self.mock_dynamodb_client.execute_statement.call_count)
+        second_call = self.mock_dynamodb_client.execute_statement.call_args_list[
+            1
+        ].kwargs
+        self.assertEqual("page2", second_call["NextToken"])
+
+    def test_records_paginated_page_size_and_total_limit(self, mock_logger_arg):
+        """Test records_paginated() pages by page_size but caps the total at limit."""
+        config = self._get_base_config(table_name="users", select_all=True, limit=3)
+        self.mock_dynamodb_client.execute_statement.side_effect = [
+            {
+                "Items": [{"id": {"S": "user1"}}, {"id": {"S": "user2"}}],
+                "NextToken": "page2",
+            },
+            {
+                "Items": [{"id": {"S": "user3"}}, {"id": {"S": "user4"}}],
+                "NextToken": "page3",
+            },
+        ]
+
+        results = list(
+            self.backend.records_paginated(config, self.mock_model, page_size=2)
+        )
+
+        self.assertEqual(
+            results, [{"id": "user1"}, {"id": "user2"}, {"id": "user3"}]
+        )
+        self.assertEqual(2, self.mock_dynamodb_client.execute_statement.call_count)
+        first_call = self.mock_dynamodb_client.execute_statement.call_args_list[
+            0
+        ].kwargs
+        self.assertEqual(2, first_call["Limit"])
+
     def test_create_record(self, mock_logger_arg):
         """Test create() inserts a record and returns the input data."""
         data_to_create = {"id": "new_user_123", "name": "Jane Doe", "age": 28}
@@ -488,6 +602,82 @@ class TestDynamoDBPartiQLBackend(unittest.TestCase):
             Parameters=expected_ddb_parameters,
         )
 
+    def test_binary_values_round_trip(self, mock_logger_arg):
+        """Test that bytes written via create() read back unchanged through records()."""
+        blob = b"\x00\xff\x10 abcd"
+        self.mock_dynamodb_client.execute_statement.return_value = {}
+        self.backend.create({"id": "user1", "blob": blob}, self.mock_model)
+
+        # boto3 does the wire base64 itself, so the parameters carry raw bytes
+        written_parameters = self.mock_dynamodb_client.execute_statement.call_args.kwargs[
+            "Parameters"
+        ]
+        self.assertEqual(written_parameters, [{"S": "user1"}, {"B": blob}])
+
+        # feeding the same attribute values back (as botocore returns them: raw bytes)
+        # must yield the original bytes, not a second base64 decode of them
+        config = self._get_base_config(table_name="users", select_all=True)
+        self.mock_dynamodb_client.execute_statement.return_value = {
+            "Items": [{"id": {"S": "user1"}, "blob": {"B": blob}, "blobs": {"BS": [blob]}}],
+        }
+        results = list(self.backend.records(config, self.mock_model))
+        self.assertEqual(
+            results[0], {"id": "user1", "blob": blob, "blobs": {blob}}
+        )
+        mock_logger_arg.warning.assert_not_called()
+
+    def test_create_many_batches_inserts(self, mock_logger_arg):
+        """Test create_many() groups inserts into 25-statement batch calls."""
+        data_list = [{"id": f"user{index}", "age": index} for index in range(30)]
+        self.mock_dynamodb_client.batch_execute_statement.return_value = {
+            "Responses": []
+        }
+
+        created = self.backend.create_many(data_list, self.mock_model)
+
+        self.assertEqual(created, data_list)
+        self.assertEqual(
+            2, self.mock_dynamodb_client.batch_execute_statement.call_count
+        )
+        batch_calls = self.mock_dynamodb_client.batch_execute_statement.call_args_list
+        self.assertEqual(25, len(batch_calls[0].kwargs["Statements"]))
+        self.assertEqual(5, len(batch_calls[1].kwargs["Statements"]))
+        first_statement = batch_calls[0].kwargs["Statements"][0]
+        self.assertEqual(
+            "INSERT INTO \"my_test_table\" VALUE {'id': ?, 'age': ?}",
+            first_statement["Statement"],
+        )
+        self.assertEqual([{"S": "user0"}, {"N": "0"}], first_statement["Parameters"])
+
+    def test_create_many_retries_failed_statements(self, mock_logger_arg):
+        """Test create_many() retries only the statements that errored in a batch."""
+        data_list = [{"id": "user1"}, {"id": "user2"}]
+        self.mock_dynamodb_client.batch_execute_statement.side_effect = [
+            {
+                "Responses": [
+                    {},
+                    {"Error": {"Code": "ThrottlingException", "Message": "slow down"}},
+                ]
+            },
+            {"Responses": [{}]},
+        ]
+
+        with patch(
+            "clearskies_aws.backends.dynamo_db_parti_ql_backend.time.sleep"
+        ) as mock_sleep:
+            created = self.backend.create_many(data_list, self.mock_model)
+
+        self.assertEqual(created, data_list)
+        self.assertEqual(
+            2, self.mock_dynamodb_client.batch_execute_statement.call_count
+        )
+        retry_call = self.mock_dynamodb_client.batch_execute_statement.call_args_list[
+            1
+        ].kwargs
+        self.assertEqual(1, len(retry_call["Statements"]))
+        self.assertEqual([{"S": "user2"}], retry_call["Statements"][0]["Parameters"])
+        mock_sleep.assert_called_once()
+
     def test_update_record(self, mock_logger_arg):
         """Test update() modifies a record and returns the updated data."""
         record_id = "user_to_update"
@@ -31,10 +31,10 @@ class LambdaAPIGateway(InputOutput):
             self.set_header('content-type', 'application/json; charset=UTF-8')
 
         is_base64 = False
-        if type(body) == bytes:
+        if isinstance(body, bytes):
             is_base64 = True
             final_body = base64.encodebytes(body).decode('utf8')
-        elif type(body) == str:
+        elif isinstance(body, str):
             final_body = body
         else:
             final_body = json.dumps(body)
@@ -1,5 +1,4 @@
 from .lambda_api_gateway import LambdaAPIGateway
-import json
 from clearskies.handlers.exceptions import ClientError
 class LambdaInvocation(LambdaAPIGateway):
     def __init__(
@@ -31,4 +30,4 @@ class LambdaInvocation(LambdaAPIGateway):
         return self._event
 
     def respond(self, body, status_code=200):
-        return body.decode('utf-8') if type(body) == bytes else body
+        return body.decode('utf-8') if isinstance(body, bytes) else body
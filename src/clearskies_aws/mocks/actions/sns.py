@@ -1,4 +1,4 @@
-from types import ModuleType
+from typing import Callable
 from clearskies import Model
 from ...actions.sns import SNS as BaseSNS
 class SNS(BaseSNS):
@@ -12,7 +12,7 @@ class SNS(BaseSNS):
         cls.calls = []
         di.mock_class(BaseSNS, SNS)
 
-    def _execute_action(self, client: ModuleType, model: Model) -> None:
+    def _execute_action(self, get_client: Callable, model: Model) -> None:
         """Send a notification as configured."""
         if SNS.calls == None:
             SNS.calls = []
@@ -1,4 +1,4 @@
-from types import ModuleType
+from typing import Callable
 from clearskies import Model
 from ...actions.sqs import SQS as BaseSQS
 class SQS(BaseSQS):
@@ -12,7 +12,7 @@ class SQS(BaseSQS):
         cls.calls = []
         di.mock_class(BaseSQS, SQS)
 
-    def _execute_action(self, client: ModuleType, model: Model) -> None:
+    def _execute_action(self, get_client: Callable, model: Model) -> None:
         """Send a notification as configured."""
         if SQS.calls == None:
             SQS.calls = []
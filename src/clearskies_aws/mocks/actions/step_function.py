@@ -1,4 +1,4 @@
-from types import ModuleType
+from typing import Callable
 from clearskies import Model
 from ...actions.step_function import StepFunction as BaseStepFunction
 class StepFunction(BaseStepFunction):
@@ -12,7 +12,7 @@ class StepFunction(BaseStepFunction):
         StepFunction.calls = []
         di.mock_class(BaseStepFunction, StepFunction)
 
-    def _execute_action(self, client: ModuleType, model: Model) -> None:
+    def _execute_action(self, get_client: Callable, model: Model) -> None:
         """Send a notification as configured."""
         if StepFunction.calls == None:
             StepFunction.calls = []
@@ -1,9 +1,4 @@
 from clearskies.secrets.additional_configs import MySQLConnectionDynamicProducerViaSSHCertBastion as Base
-from pathlib import Path
-import socket
-import subprocess
-import os
-import time
 class MySQLConnectionDynamicProducerViaSSHCertBastion(Base):
     _config = None
     _boto3 = None
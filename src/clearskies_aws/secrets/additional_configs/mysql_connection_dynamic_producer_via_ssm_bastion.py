@@ -1,5 +1,4 @@
 from .mysql_connection_dynamic_producer_via_ssh_cert_bastion import MySQLConnectionDynamicProducerViaSSHCertBastion as Base
-from pathlib import Path
 import socket
 import subprocess
 import os